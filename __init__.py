@@ -1,47 +1,77 @@
 # Deep_Data/__init__.py
 
-# Import the main GUI class
-from .gui import MainGUI
-
-# Import data import functions
-from .data_import import import_data
-
-# Import method storage functions
-from .method_storage import save_method, load_method, apply_method
-
-# Import preprocessing functions
-from .preprocessing import (
-    apply_mathematical_transformation,
-    truncate_data,
-    fill_missing_values,
-    encode_categorical
-)
-
-# Import visualization functions
-from .visualization import (
-    plot_single_distribution,
-    plot_cross_relationship,
-    reduce_and_plot
-)
-
-# Import modeling functions
-from .modeling import (
-    train_model,
-    tune_hyperparameters,
-    plot_predictions
-)
-
-# Import post-analysis functions
-from .post_analysis import perform_shap_analysis
-
-# Import exporting functions
-from .exporting import (
-    export_plot,
-    export_data,
-    export_model,
-    export_method,
-    export_shap_data
-)
+import importlib
+import sys
+
+# Public names and the submodules that define them. Submodules are only
+# imported on first attribute access (PEP 562), so `import Deep_Data` does not
+# pull in tkinter, matplotlib or pandas.
+_LAZY_ATTRIBUTES = {
+    # Main GUI class
+    'MainGUI': '.gui',
+
+    # Data import functions
+    'import_data': '.data_import',
+
+    # Method storage functions
+    'save_method': '.method_storage',
+    'load_method': '.method_storage',
+    'apply_method': '.method_storage',
+
+    # Preprocessing functions
+    'apply_mathematical_transformation': '.preprocessing',
+    'truncate_data': '.preprocessing',
+    'fill_missing_values': '.preprocessing',
+    'encode_categorical': '.preprocessing',
+
+    # Visualization functions
+    'plot_single_distribution': '.visualization',
+    'plot_cross_relationship': '.visualization',
+    'reduce_and_plot': '.visualization',
+
+    # Modeling functions
+    'train_model': '.modeling',
+    'tune_hyperparameters': '.modeling',
+    'plot_predictions': '.modeling',
+
+    # Post-analysis functions
+    'perform_shap_analysis': '.post_analysis',
+
+    # Exporting functions
+    'export_plot': '.exporting',
+    'export_data': '.exporting',
+    'export_model': '.exporting',
+    'export_method': '.exporting',
+    'export_shap_data': '.exporting',
+}
+
+def _resolve(name):
+    """The object behind a public name, AttributeError if its module or definition does not exist yet."""
+    module_name = _LAZY_ATTRIBUTES[name]
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ModuleNotFoundError as e:
+        if e.name != __name__ + module_name:
+            # A missing third-party dependency is a real error
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
+    return getattr(module, name)
+
+def __getattr__(name):
+    """Import the submodule defining a public name on first access."""
+    if name == '__all__':
+        # Built on first use (e.g. by a star import), listing only names that resolve
+        value = [attr for attr in _LAZY_ATTRIBUTES if hasattr(sys.modules[__name__], attr)]
+    elif name in _LAZY_ATTRIBUTES:
+        value = _resolve(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 # Optional package metadata
 __version__ = "0.1.0"
@@ -0,0 +1,57 @@
+"""
+Check that `import Deep_Data` stays within a fixed time budget and loads no heavy dependencies.
+
+The package is imported in a fresh interpreter with `-X importtime`, the
+cumulative time of the Deep_Data import is read from its report, and the run
+fails if it exceeds the budget or if tkinter, matplotlib or pandas were loaded.
+
+Usage:
+    python benchmarks/import_time.py [--budget-ms 50]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Default budget for the package import, in milliseconds
+DEFAULT_BUDGET_MS = 50
+
+# Modules a bare package import must not load
+HEAVY_MODULES = ('tkinter', 'matplotlib', 'pandas', 'numpy')
+
+def measure_import():
+    """
+    Import the package in a subprocess without a display.
+
+    Returns:
+        tuple: (milliseconds spent importing Deep_Data, list of heavy modules loaded).
+    """
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # The repository directory is the package, imported under its directory name
+    package = os.path.basename(package_dir)
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(package_dir))
+    env.pop('DISPLAY', None)
+    check = f"import sys, {package}; print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', check],
+                            capture_output=True, text=True, env=env, check=True)
+    # Report lines read "import time: self [us] | cumulative | imported package"
+    cumulative = [int(line.split('|')[1]) for line in result.stderr.splitlines()
+                  if line.startswith('import time:') and line.split('|')[2].strip() == package]
+    if not cumulative:
+        raise RuntimeError(f"No import time reported for {package}:\n{result.stderr}")
+    return cumulative[0] / 1000, result.stdout.split()
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time of Deep_Data.")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help="Largest allowed import time in milliseconds.")
+    args = parser.parse_args()
+    elapsed, heavy = measure_import()
+    print(f"import Deep_Data: {elapsed:.1f} ms (budget {args.budget_ms:g} ms)")
+    if heavy:
+        print(f"Loaded heavy modules: {', '.join(heavy)}")
+    if heavy or elapsed > args.budget_ms:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
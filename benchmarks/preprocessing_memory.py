@@ -0,0 +1,113 @@
+"""
+Measure the peak memory of preprocessing steps in copy-on-write, in-place and full-copy modes.
+
+Each step runs in a fresh interpreter on a synthetic frame of float64 columns,
+and the peak resident set size is read from the operating system afterwards. On
+Linux the peak is reset once the frame is built; elsewhere building the frame
+may dominate the peak.
+
+Copy-on-write and in-place steps should only add the memory of the columns they
+create or modify; the full-copy reference shows what duplicating the frame costs.
+
+Usage:
+    python benchmarks/preprocessing_memory.py [--gigabytes 5] [--columns 20]
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+
+# Steps measured, each run on the synthetic frame
+STEPS = ('transform', 'truncate', 'fill', 'encode')
+
+# Modes: 'cow' shares unchanged columns, 'inplace' modifies the frame, 'copy' duplicates it first
+MODES = ('cow', 'inplace', 'copy')
+
+def _status_mb(field):
+    """A memory field of /proc/self/status in megabytes, None where it does not exist."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+
+def _reset_peak():
+    """Reset the peak RSS to the current RSS (Linux only), so building the frame is not counted."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in megabytes."""
+    peak = _status_mb('VmHWM')
+    if peak is not None:
+        return peak
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, other systems kilobytes
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+def _make_frame(n_rows, n_columns):
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(0)
+    data = {f"c{i}": rng.standard_normal(n_rows) for i in range(n_columns)}
+    # A sorted column to truncate on, one with gaps to fill and one of text to encode
+    data['time'] = np.arange(n_rows, dtype=np.float64)
+    data['c0'][::10] = np.nan
+    data['label'] = pd.Categorical.from_codes(rng.integers(0, 8, n_rows), list('abcdefgh'))
+    return pd.DataFrame(data)
+
+def run_step(step, mode, n_rows, n_columns):
+    """
+    Run one step on a new frame in this process.
+
+    Returns:
+        tuple: (RSS in MB after building the frame, peak RSS in MB during the step).
+    """
+    package = os.path.basename(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    preprocessing = __import__(f"{package}.preprocessing", fromlist=['preprocessing'])
+    df = _make_frame(n_rows, n_columns)
+    _reset_peak()
+    before = _status_mb('VmRSS') or _peak_rss_mb()
+    if mode == 'copy':
+        df = df.copy()
+    inplace = mode == 'inplace'
+    if step == 'transform':
+        df = preprocessing.apply_mathematical_transformation(df, "c1 = log10(abs(c1) + 1)", inplace=inplace)
+    elif step == 'truncate':
+        df = preprocessing.truncate_data(df, 'time', 0, n_rows // 2, inplace=inplace)
+    elif step == 'fill':
+        df = preprocessing.fill_missing_values(df, ['c0'], 'mean', inplace=inplace)
+    elif step == 'encode':
+        df = preprocessing.encode_categorical(df, ['label'], 'ordinal', inplace=inplace)
+    return before, _peak_rss_mb()
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak memory of preprocessing steps.")
+    parser.add_argument('--gigabytes', type=float, default=5, help="Size of the float columns of the frame.")
+    parser.add_argument('--columns', type=int, default=20, help="Number of float columns.")
+    parser.add_argument('--run', nargs=2, metavar=('STEP', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    n_rows = int(args.gigabytes * 1024 ** 3 / 8 / (args.columns + 1))
+    if args.run:
+        print(*run_step(*args.run, n_rows, args.columns))
+        return
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(package_dir))
+    print(f"{n_rows:,} rows x {args.columns + 2} columns, peak RSS in MB")
+    print(f"{'step':<10}{'mode':<9}{'frame':>10}{'peak':>10}{'added':>10}")
+    for step in STEPS:
+        for mode in MODES:
+            result = subprocess.run([sys.executable, os.path.abspath(__file__), '--gigabytes', str(args.gigabytes),
+                                     '--columns', str(args.columns), '--run', step, mode],
+                                    capture_output=True, text=True, env=env, check=True)
+            before, peak = map(float, result.stdout.split())
+            print(f"{step:<10}{mode:<9}{before:>10.0f}{peak:>10.0f}{peak - before:>10.0f}")
+
+if __name__ == "__main__":
+    main()
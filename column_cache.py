@@ -0,0 +1,109 @@
+import threading
+import weakref
+from collections import OrderedDict
+import numpy as np
+
+# Bumped by mark_written; entries stored under an older version are stale
+_write_version = 0
+
+def mark_written():
+    """
+    Invalidate every cached value after writing into columns in place.
+
+    Preprocessing steps replace columns rather than writing into them, so they never
+    need this. Code that modifies a column's buffer directly, such as
+    df.loc[i, col] = v or series.to_numpy()[i] = v, must call it afterwards.
+    """
+    global _write_version
+    _write_version += 1
+
+class ColumnCache:
+    """
+    Small thread-safe LRU cache of values derived from columns, keyed by the columns' buffers.
+
+    Entries do not reference the columns. Each holds a weak reference to the owner
+    of every buffer, so a freed address that is reused by a new column is not
+    mistaken for the cached one, and the write version current when it was stored
+    (see mark_written). Only numpy-backed columns are cached.
+
+    Wherever a column is accepted, a list of columns may be given instead; the
+    cached value is then tied to all of them.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        # The Tk loop and the render worker share the module-level caches
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _columns(series):
+        """The columns of a key, or None if any of them cannot be cached."""
+        columns = series if isinstance(series, (list, tuple)) else [series]
+        return columns if all(isinstance(col.dtype, np.dtype) for col in columns) else None
+
+    @staticmethod
+    def _key(columns, extra):
+        parts, owners = [], []
+        for col in columns:
+            values = col.to_numpy()
+            owners.append(values if values.base is None else values.base)
+            parts.append((values.__array_interface__['data'][0], values.shape, values.strides, values.dtype.str))
+        return (tuple(parts), extra), owners
+
+    @staticmethod
+    def _valid(entry, owners=None):
+        """Whether nothing was written since an entry was stored and its buffers' owners are still alive."""
+        refs, version, _ = entry
+        if version != _write_version:
+            return False
+        if owners is None:
+            return all(ref() is not None for ref in refs)
+        return all(ref() is owner for ref, owner in zip(refs, owners))
+
+    def get(self, series, extra=None):
+        """
+        Cached value for a column, or None.
+
+        Args:
+            series (pd.Series or list of pd.Series): The column or columns.
+            extra (hashable, optional): Further key part, e.g. a bin specification.
+        """
+        columns = self._columns(series)
+        if columns is None:
+            return None
+        key, owners = self._key(columns, extra)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if not self._valid(entry, owners):
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[2]
+
+    def put(self, series, value, extra=None):
+        """Remember a value for a column, evicting stale and least recently used entries."""
+        columns = self._columns(series)
+        if columns is None:
+            return
+        key, owners = self._key(columns, extra)
+        try:
+            hash(key)
+            refs = [weakref.ref(owner) for owner in owners]
+        except TypeError:
+            return
+        with self.lock:
+            # Drop entries whose columns were freed or written, releasing their values
+            for stale in [k for k, entry in self.entries.items() if not self._valid(entry)]:
+                del self.entries[stale]
+            self.entries[key] = (refs, _write_version, value)
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry."""
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+
+# Directory holding cached copies of imported files
+DEFAULT_CACHE_DIR = os.environ.get(
+    'DEEP_DATA_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'deep_data'))
+
+# Total size the cache directory may grow to before old entries are evicted
+DEFAULT_CACHE_BYTES = 2 * 1024 ** 3
+
+# Extension of cache entries (Arrow IPC / Feather v2)
+CACHE_SUFFIX = '.arrow'
+
+def cache_key(file_path, dialect=None, **options):
+    """
+    Build the cache key of a file from its path, size, modification time and parse options.
+
+    Args:
+        file_path (str): Path to the source data file.
+        dialect (dict, optional): Dialect the file was parsed with.
+        **options: Any other parse options that change the resulting DataFrame.
+
+    Returns:
+        str: Hex digest identifying the parsed contents of the file.
+    """
+    stat = os.stat(file_path)
+    fingerprint = {
+        'path': os.path.abspath(file_path),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime_ns,
+        'dialect': dialect,
+        'options': options,
+    }
+    return hashlib.sha1(json.dumps(fingerprint, sort_keys=True, default=str).encode()).hexdigest()
+
+def _entry_path(key, cache_dir):
+    """Path of the cache entry for a key."""
+    return os.path.join(cache_dir, key + CACHE_SUFFIX)
+
+def _is_missing(value):
+    return value is None or value != value
+
+def _arrow_filter(predicate):
+    """
+    Convert (column, op, value) conditions into a pyarrow compute expression.
+
+    Missing values are stored as nulls, which Arrow comparisons propagate and
+    filters drop. They are resolved as pandas compares NaN instead: != and not in
+    keep them, the other comparisons drop them, and in keeps them when the values
+    include NaN or None, so filtering the cached copy matches the uncached import.
+    """
+    import pyarrow.compute as pc
+    expression = None
+    for col, op, value in predicate:
+        field = pc.field(str(col))
+        if op in ('in', 'not in'):
+            present = [v for v in value if not _is_missing(v)]
+            condition = field.isin(present) if present else pc.scalar(False)
+            if len(present) < len(value):
+                condition = condition | field.is_null()
+            if op == 'not in':
+                condition = ~condition
+        else:
+            condition = {
+                '==': field == value,
+                '!=': field != value,
+                '<': field < value,
+                '<=': field <= value,
+                '>': field > value,
+                '>=': field >= value,
+            }[op]
+            if op == '!=':
+                condition = condition | field.is_null()
+        expression = condition if expression is None else expression & condition
+    return expression
+
+def load_frame(key, cache_dir=None, columns=None, predicate=None):
+    """
+    Load a cached DataFrame by key, memory-mapping its Arrow IPC file.
+
+    Column projection and row filtering run on the memory-mapped Arrow table, so
+    only the selected data is converted to pandas.
+
+    Args:
+        key (str): Cache key of the entry.
+        cache_dir (str, optional): Cache directory, defaults to DEFAULT_CACHE_DIR.
+        columns (list, optional): Columns to read.
+        predicate (list of tuple, optional): (column, op, value) conditions rows must satisfy.
+
+    Returns:
+        pd.DataFrame or None: The cached DataFrame, or None on a cache miss or
+            when pyarrow is not installed.
+    """
+    try:
+        from pyarrow import feather
+    except ImportError:
+        return None
+    path = _entry_path(key, cache_dir or DEFAULT_CACHE_DIR)
+    if not os.path.exists(path):
+        return None
+    try:
+        table = feather.read_table(path, columns=None if columns is None else [str(col) for col in columns],
+                                   memory_map=True)
+    except Exception:
+        # A corrupt or partially written entry is dropped and rebuilt
+        _remove(path)
+        return None
+    if predicate:
+        table = table.filter(_arrow_filter(predicate))
+    df = table.to_pandas()
+    # Mark the entry as recently used for LRU eviction
+    os.utime(path)
+    return df
+
+def load_cached(file_path, dialect=None, cache_dir=None, columns=None, predicate=None, **options):
+    """
+    Load the cached copy of a parsed file (see load_frame).
+
+    Args:
+        file_path (str): Path to the source data file.
+        dialect (dict, optional): Dialect the file was parsed with.
+        cache_dir (str, optional): Cache directory, defaults to DEFAULT_CACHE_DIR.
+        columns (list, optional): Columns to read.
+        predicate (list of tuple, optional): (column, op, value) conditions rows must satisfy.
+        **options: Other parse options that were part of the cache key.
+
+    Returns:
+        pd.DataFrame or None: The cached DataFrame, or None on a cache miss or
+            when pyarrow is not installed.
+    """
+    return load_frame(cache_key(file_path, dialect, **options), cache_dir, columns, predicate)
+
+def store_frame(key, df, cache_dir=None, max_bytes=DEFAULT_CACHE_BYTES):
+    """
+    Store a DataFrame in the cache under a key and evict old entries above the size limit.
+
+    Caching is best effort: DataFrames that Arrow cannot represent or that are larger
+    than max_bytes, or a missing pyarrow installation, leave the cache untouched.
+
+    Args:
+        key (str): Cache key of the entry.
+        df (pd.DataFrame): The data to store.
+        cache_dir (str, optional): Cache directory, defaults to DEFAULT_CACHE_DIR.
+        max_bytes (int): Maximum total size of the cache directory.
+
+    Returns:
+        bool: Whether the DataFrame was written to the cache.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+    except ImportError:
+        return False
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    path = _entry_path(key, cache_dir)
+    tmp_path = path + '.tmp'
+    try:
+        table = pa.Table.from_pandas(df)
+    except Exception:
+        return False
+    # An entry that cannot fit would only evict everything else and then itself
+    if table.nbytes > max_bytes:
+        return False
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Uncompressed so the entry can be memory-mapped on reload
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, path)
+    except Exception:
+        _remove(tmp_path)
+        return False
+    evict(cache_dir, max_bytes, keep=path)
+    return True
+
+def store_cached(df, file_path, dialect=None, cache_dir=None, max_bytes=DEFAULT_CACHE_BYTES, **options):
+    """
+    Store a parsed DataFrame in the cache (see store_frame).
+
+    Args:
+        df (pd.DataFrame): The parsed data.
+        file_path (str): Path to the source data file.
+        dialect (dict, optional): Dialect the file was parsed with.
+        cache_dir (str, optional): Cache directory, defaults to DEFAULT_CACHE_DIR.
+        max_bytes (int): Maximum total size of the cache directory.
+        **options: Other parse options that are part of the cache key.
+
+    Returns:
+        bool: Whether the DataFrame was written to the cache.
+    """
+    return store_frame(cache_key(file_path, dialect, **options), df, cache_dir, max_bytes)
+
+def evict(cache_dir=None, max_bytes=DEFAULT_CACHE_BYTES, keep=None):
+    """
+    Delete the least recently used cache entries until the cache fits in max_bytes.
+
+    Args:
+        cache_dir (str, optional): Cache directory, defaults to DEFAULT_CACHE_DIR.
+        max_bytes (int): Maximum total size of the cache directory.
+        keep (str, optional): Path of an entry never to delete, e.g. the one just written.
+    """
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    if not os.path.isdir(cache_dir):
+        return
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(CACHE_SUFFIX):
+            path = os.path.join(cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        _remove(path)
+        total -= size
+
+def clear_cache(cache_dir=None):
+    """
+    Delete every entry in the cache directory.
+
+    Args:
+        cache_dir (str, optional): Cache directory, defaults to DEFAULT_CACHE_DIR.
+    """
+    evict(cache_dir, max_bytes=0)
+
+def _remove(path):
+    """Delete a file if it exists."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -1,48 +1,633 @@
+import csv
+import glob
+import io
+import operator
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import reduce
 import pandas as pd
-import tkinter as tk
-from tkinter import ttk
+from .data_cache import load_cached, store_cached
+from .data_types import DTYPE_SAMPLE_ROWS, infer_schema, downcast_floats, downcast_integers, memory_report
 
-def import_data(file_path):
+# Candidate separators for .txt files, in order of preference on ties
+TXT_SEPARATORS = [';', '\t', ',', ' ']
+
+# Number of bytes read from the head of a file to detect its dialect
+DIALECT_SAMPLE_BYTES = 64 * 1024
+
+# Default number of rows per chunk in streaming mode
+DEFAULT_CHUNKSIZE = 100_000
+
+# Dialect used for .csv files (pandas defaults)
+CSV_DIALECT = {'sep': ',', 'quotechar': '"', 'decimal': '.', 'header': 0}
+
+# Comparison operators allowed in row predicates
+PREDICATE_OPS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda series, values: series.isin(values),
+    'not in': lambda series, values: ~series.isin(values),
+}
+
+_NUMBER_DOT = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$')
+_NUMBER_COMMA = re.compile(r'^[+-]?\d+,\d+([eE][+-]?\d+)?$')
+
+class ImportCancelled(Exception):
+    """Raised by a progress callback to abort an import in progress."""
+
+class _ProgressFileIO(io.FileIO):
+    """Raw file that reports the bytes consumed by the reader after every read."""
+
+    def __init__(self, file_path, progress):
+        super().__init__(file_path, 'rb')
+        self._progress = progress
+        self._total = os.fstat(self.fileno()).st_size
+
+    def readinto(self, buffer):
+        n = super().readinto(buffer)
+        self._progress(self.tell(), self._total)
+        return n
+
+def _read_sample_lines(file_path, sample_bytes):
+    """Read a bounded sample from the head of a file and split it into complete lines."""
+    with open(file_path, 'rb') as f:
+        raw = f.read(sample_bytes)
+        truncated = bool(f.read(1))
+    text = raw.decode('utf-8', errors='replace')
+    if text.startswith('\ufeff'):
+        text = text[1:]
+    lines = text.splitlines()
+    # Drop the last line if the sample cut it in half
+    if truncated and len(lines) > 1:
+        lines = lines[:-1]
+    return [line for line in lines if line.strip()]
+
+def _split_lines(lines, sep, quotechar):
+    """Split sample lines into fields with the given separator."""
+    if sep == ' ':
+        # Runs of spaces count as one separator
+        return [line.split() for line in lines]
+    return list(csv.reader(lines, delimiter=sep, quotechar=quotechar))
+
+def _guess_quotechar(lines):
+    """Pick the quote character that wraps fields in the sample."""
+    text = '\n'.join(lines)
+    if text.count('"') >= 2:
+        return '"'
+    if re.search(r"(^|[;\t, ])'[^'\n]*'([;\t, ]|$)", text, re.MULTILINE):
+        return "'"
+    return '"'
+
+def _is_number(value, decimal):
+    """Check whether a field looks numeric with the given decimal mark."""
+    value = value.strip()
+    if decimal == ',':
+        return bool(_NUMBER_COMMA.match(value)) or value.isdigit()
+    return bool(_NUMBER_DOT.match(value))
+
+def detect_dialect(file_path, sample_bytes=DIALECT_SAMPLE_BYTES):
     """
-    Import data from a file based on its extension.
+    Detect the dialect of a delimited text file from a sample of its first bytes.
+    
+    Args:
+        file_path (str): Path to the text file.
+        sample_bytes (int): Maximum number of bytes to inspect from the head of the file.
+    
+    Returns:
+        dict: The detected 'sep', 'quotechar', 'decimal' and 'header' (0 or None),
+            ready to be passed to pd.read_csv. Without a header row, 'names' holds
+            the default column names column_1, column_2, ... as in assign_column_names.
+    
+    Raises:
+        ValueError: If no separator splits the sample into multiple columns.
+    """
+    lines = _read_sample_lines(file_path, sample_bytes)
+    if not lines:
+        raise ValueError("Could not determine the separator for the .txt file.")
+    quotechar = _guess_quotechar(lines)
+
+    # Score each separator by how consistently it splits the sample lines
+    best_sep, best_score, best_rows = None, None, None
+    for sep in TXT_SEPARATORS:
+        rows = _split_lines(lines, sep, quotechar)
+        counts = [len(row) for row in rows]
+        width = max(set(counts), key=counts.count)
+        if width < 2:
+            continue
+        score = (counts.count(width) / len(counts), width)
+        if best_score is None or score > best_score:
+            best_sep, best_score, best_rows = sep, score, rows
+    if best_sep is None:
+        raise ValueError("Could not determine the separator for the .txt file.")
+
+    # A comma can only be the decimal mark when it is not the separator
+    fields = [field for row in best_rows[1:] for field in row]
+    decimal = '.'
+    if best_sep != ',':
+        comma = sum(bool(_NUMBER_COMMA.match(f.strip())) for f in fields)
+        dot = sum(bool(_NUMBER_DOT.match(f.strip())) and '.' in f for f in fields)
+        if comma > dot:
+            decimal = ','
+
+    # The first row is a header if it has text where the body has numbers
+    header = 0
+    first, body = best_rows[0], best_rows[1:]
+    if body:
+        numeric_cols = [
+            i for i in range(len(first))
+            if sum(_is_number(row[i], decimal) for row in body if i < len(row)) > len(body) / 2
+        ]
+        if numeric_cols and all(_is_number(first[i], decimal) for i in numeric_cols):
+            header = None
+
+    if best_sep == ' ':
+        best_sep = r'\s+'
+    dialect = {'sep': best_sep, 'quotechar': quotechar, 'decimal': decimal, 'header': header}
+    if header is None:
+        # Named columns can be referenced in expressions, unlike pandas' integer labels
+        width = max(len(row) for row in best_rows)
+        dialect['names'] = [f"column_{i+1}" for i in range(width)]
+    return dialect
+
+def _validate_predicate(predicate):
+    """Check that a predicate is a list of (column, op, value) conditions."""
+    for condition in predicate:
+        if len(condition) != 3 or condition[1] not in PREDICATE_OPS:
+            raise ValueError(f"Invalid predicate condition {condition!r}; expected (column, op, value) "
+                             f"with op in {list(PREDICATE_OPS)}.")
+
+def _projection(columns, predicate):
+    """Columns the reader must parse to select the requested columns and evaluate the predicate."""
+    if columns is None:
+        return None
+    usecols = list(columns)
+    for col, _, _ in predicate or []:
+        if col not in usecols:
+            usecols.append(col)
+    return usecols
+
+def _select(df, columns=None, predicate=None):
+    """Keep the rows matching every predicate condition and the requested columns."""
+    if predicate:
+        masks = [PREDICATE_OPS[op](df[col], value) for col, op, value in predicate]
+        df = df[reduce(operator.and_, masks).to_numpy()].reset_index(drop=True)
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+def _excel_engine():
+    """Return 'calamine' when python-calamine is installed, else None for the pandas default."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None
+    return 'calamine'
+
+def list_sheets(file_path):
+    """
+    List the sheet names of an Excel workbook without loading its cells.
+    
+    Args:
+        file_path (str): Path to the .xlsx file.
+    
+    Returns:
+        list of str: The sheet names in workbook order.
+    """
+    if _excel_engine() == 'calamine':
+        from python_calamine import CalamineWorkbook
+        return list(CalamineWorkbook.from_path(file_path).sheet_names)
+    from openpyxl import load_workbook
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+def _iter_excel_rows(source, sheet_name=0):
+    """Yield the rows of an Excel sheet as sequences of values, header row first."""
+    if _excel_engine() == 'calamine':
+        from python_calamine import CalamineWorkbook
+        if isinstance(source, str):
+            workbook = CalamineWorkbook.from_path(source)
+        else:
+            workbook = CalamineWorkbook.from_filelike(source)
+        if isinstance(sheet_name, int):
+            sheet = workbook.get_sheet_by_index(sheet_name)
+        else:
+            sheet = workbook.get_sheet_by_name(sheet_name)
+        # Calamine reports empty cells as '', which pandas reads as missing
+        for row in sheet.iter_rows():
+            yield [None if value == '' else value for value in row]
+        return
+
+    from openpyxl import load_workbook
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, int):
+            sheet = workbook.worksheets[sheet_name]
+        else:
+            sheet = workbook[sheet_name]
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+def _build_chunk(rows, columns, dtype=None, usecols=None, reference=None):
+    """
+    Build a DataFrame chunk from buffered Excel rows.
+
+    Args:
+        reference (dict, optional): Column dtypes of the first chunk. Integer columns
+            are only restored where the first chunk had them, so a column keeps one
+            dtype across chunks whenever its values allow it.
+    """
+    chunk = pd.DataFrame(rows, columns=columns)
+    if usecols is not None:
+        chunk = chunk[usecols]
+    # Columns of numbers mixed with missing cells start out as objects
+    chunk = chunk.infer_objects()
+    # Calamine reports every number as a float; restore integer columns like pandas does
+    for col in chunk.columns:
+        values = chunk[col]
+        if reference is not None and not pd.api.types.is_integer_dtype(reference.get(col)):
+            continue
+        if values.dtype == 'float64' and not values.isna().any() and (values % 1 == 0).all():
+            chunk[col] = values.astype('int64')
+    if dtype:
+        chunk = chunk.astype({col: dt for col, dt in dtype.items() if col in chunk.columns})
+    return chunk
+
+def _header_names(header):
+    """Column names from a header row, naming blanks and numbering duplicates as pandas does (a, a.1)."""
+    names = [f"Unnamed: {i}" if name in (None, '') else name for i, name in enumerate(header)]
+    original = set(names)
+    counts = {}
+    for i, name in enumerate(names):
+        base, count = name, counts.get(name, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            # Skip suffixed names that already appear in the header
+            count = count + 1 if name in original else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+def _iter_excel_chunks(source, chunksize, sheet_name=0, dtype=None, usecols=None):
+    """Stream rows of an Excel sheet and yield them as DataFrame chunks."""
+    rows = _iter_excel_rows(source, sheet_name)
+    header = next(rows, None)
+    if header is None:
+        return
+    columns = _header_names(header)
+    buffer, reference = [], None
+    for row in rows:
+        buffer.append(row)
+        if len(buffer) == chunksize:
+            chunk = _build_chunk(buffer, columns, dtype, usecols, reference)
+            if reference is None:
+                reference = chunk.dtypes.to_dict()
+            yield chunk
+            buffer = []
+    if buffer:
+        yield _build_chunk(buffer, columns, dtype, usecols, reference)
+
+def _read_excel(source, sheet_name=0, dtype=None, usecols=None):
+    """
+    Read a whole Excel sheet with the fastest available engine.
+    
+    Calamine is used through pandas when installed. Otherwise rows are streamed from
+    openpyxl in read-only mode, falling back to pd.read_excel if streaming fails.
+    """
+    engine = _excel_engine()
+    if engine is not None:
+        return pd.read_excel(source, sheet_name=sheet_name, dtype=dtype, usecols=usecols, engine=engine)
+    try:
+        chunks = list(_iter_excel_chunks(source, DEFAULT_CHUNKSIZE, sheet_name, usecols=usecols))
+        df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=usecols)
+        if dtype:
+            df = df.astype({col: dt for col, dt in dtype.items() if col in df.columns})
+        return df
+    except (KeyError, IndexError):
+        # A missing sheet is the caller's error, not a streaming failure
+        raise
+    except Exception:
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return pd.read_excel(source, sheet_name=sheet_name, dtype=dtype, usecols=usecols)
+
+def iter_data(file_path, chunksize=DEFAULT_CHUNKSIZE, dialect=None, sheet_name=0, dtype=None,
+              columns=None, predicate=None):
+    """
+    Stream data from a file as DataFrame chunks with bounded memory.
     
     Args:
         file_path (str): Path to the data file (.txt, .xlsx, or .csv).
+        chunksize (int): Number of rows per chunk.
+        dialect (dict, optional): Previously detected dialect to reuse for .txt files.
+        sheet_name (int or str): Sheet to stream for .xlsx files.
+        dtype (dict, optional): Mapping of column name to dtype applied to every chunk.
+        columns (list, optional): Columns to parse; all others are skipped by the reader.
+        predicate (list of tuple, optional): (column, op, value) conditions that rows must all
+            satisfy, with op one of PREDICATE_OPS.
+    
+    Yields:
+        pd.DataFrame: Consecutive chunks of at most chunksize rows (before row filtering).
+    
+    Raises:
+        ValueError: If the file type is unsupported or cannot be read.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    _validate_predicate(predicate or [])
+    usecols = _projection(columns, predicate)
+    try:
+        if file_path.endswith('.csv'):
+            with pd.read_csv(file_path, chunksize=chunksize, dtype=dtype, usecols=usecols) as reader:
+                for chunk in reader:
+                    yield _select(chunk, columns, predicate)
+        elif file_path.endswith('.xlsx'):
+            for chunk in _iter_excel_chunks(file_path, chunksize, sheet_name, dtype, usecols):
+                yield _select(chunk, columns, predicate)
+        elif file_path.endswith('.txt'):
+            if dialect is None:
+                dialect = detect_dialect(file_path)
+            with pd.read_csv(file_path, chunksize=chunksize, dtype=dtype, usecols=usecols, **dialect) as reader:
+                for chunk in reader:
+                    yield _select(chunk, columns, predicate)
+        else:
+            raise ValueError("Unsupported file type. Use .txt, .xlsx, or .csv files.")
+    except Exception as e:
+        raise ValueError(f"Error reading file: {str(e)}")
+
+def _read_sample(file_path, dialect, nrows=DTYPE_SAMPLE_ROWS, usecols=None, sheet_name=0):
+    """Parse the first rows of a file with default dtypes."""
+    if file_path.endswith('.xlsx'):
+        return pd.read_excel(file_path, sheet_name=sheet_name, nrows=nrows, usecols=usecols,
+                             engine=_excel_engine())
+    return pd.read_csv(file_path, nrows=nrows, usecols=usecols, **dialect)
+
+def import_data(file_path, dialect=None, return_dialect=False, chunksize=None, progress=None,
+                use_cache=True, cache_dir=None, optimize_dtypes=False, dtype=None, columns=None,
+                predicate=None, sheet_name=0, processes=None, source_column='source_file'):
+    """
+    Import data from a file based on its extension.
+    
+    Args:
+        file_path (str or list of str): Path to the data file (.txt, .xlsx, or .csv). A list of
+            paths or a glob pattern imports all matching files (see import_files).
+        dialect (dict, optional): Previously detected dialect to reuse for .txt files
+            instead of sniffing the file again.
+        return_dialect (bool): Whether to also return the dialect used to parse the file.
+        chunksize (int, optional): If given, stream the file instead of loading it whole
+            and return a generator of DataFrame chunks with this many rows (see iter_data).
+        progress (callable, optional): Called as progress(bytes_read, total_bytes) while the
+            file is parsed. It may raise ImportCancelled to abort the import.
+        use_cache (bool): Whether to reuse a cached columnar copy of the parsed file and to
+            store one after parsing (requires pyarrow, see data_cache).
+        cache_dir (str, optional): Cache directory, defaults to data_cache.DEFAULT_CACHE_DIR.
+        optimize_dtypes (bool): Whether to parse text with compact dtypes inferred from a
+            sample of the file (see data_types.infer_schema) and downcast numeric columns
+            after parsing: integers to the narrowest dtype holding every value, floats to
+            float32 when their written digits fit it (see data_types.downcast_floats). In
+            streaming mode only the text dtypes apply. The per-column memory before and after is stored in
+            df.attrs['memory_report'].
+        dtype (dict, optional): Mapping of column name to dtype passed to the parser; it
+            takes precedence over inferred dtypes.
+        columns (list, optional): Columns to import. Only these (and the columns the predicate
+            needs) are parsed, or read from the cached copy.
+        predicate (list of tuple, optional): (column, op, value) conditions that rows must all
+            satisfy, e.g. [('time', '>=', 10), ('time', '<', 20)]; op is one of PREDICATE_OPS.
+            Text files are parsed in chunks that are filtered as they are read, and the
+            cached copy is filtered before it is converted to pandas.
+        sheet_name (int or str): Sheet to import from .xlsx files, by position or name.
+        processes (int, optional): Worker processes used when importing several files.
+        source_column (str): Name of the column recording the source file of each row when
+            importing several files.
     
     Returns:
-        pd.DataFrame: The imported data as a pandas DataFrame.
+        pd.DataFrame: The imported data as a pandas DataFrame. If return_dialect is True,
+            a (DataFrame, dialect) tuple is returned instead; dialect is None for .xlsx files.
+            In streaming mode the DataFrame is replaced by a generator of chunks.
     
     Raises:
         ValueError: If the file type is unsupported or cannot be read.
+        ImportCancelled: If the progress callback cancelled the import.
     """
+    if not isinstance(file_path, str) or _is_glob(file_path):
+        return import_files(file_path, processes=processes, source_column=source_column,
+                            return_dialect=return_dialect, chunksize=chunksize, progress=progress,
+                            dialect=dialect, use_cache=use_cache, cache_dir=cache_dir,
+                            optimize_dtypes=optimize_dtypes, dtype=dtype, columns=columns,
+                            predicate=predicate, sheet_name=sheet_name)
+
+    _validate_predicate(predicate or [])
+    usecols = _projection(columns, predicate)
+    if chunksize is not None:
+        if file_path.endswith('.csv'):
+            dialect = dict(CSV_DIALECT)
+        elif dialect is None and file_path.endswith('.txt'):
+            try:
+                dialect = detect_dialect(file_path)
+            except Exception as e:
+                raise ValueError(f"Error reading file: {str(e)}")
+        if optimize_dtypes:
+            try:
+                sample = _read_sample(file_path, dialect, usecols=usecols, sheet_name=sheet_name)
+                dtype = {**infer_schema(sample), **(dtype or {})}
+            except Exception as e:
+                raise ValueError(f"Error reading file: {str(e)}")
+        chunks = iter_data(file_path, chunksize=chunksize, dialect=dialect, sheet_name=sheet_name,
+                           dtype=dtype, columns=columns, predicate=predicate)
+        if return_dialect:
+            return chunks, dialect
+        return chunks
+
+    handle = None
     try:
         # Determine file type based on extension
         if file_path.endswith('.csv'):
-            # Read only the first sheet for CSV
-            df = pd.read_csv(file_path)
+            dialect = dict(CSV_DIALECT)
         elif file_path.endswith('.xlsx'):
-            # Read only the first sheet for Excel
-            df = pd.read_excel(file_path, sheet_name=0)
+            dialect = None
         elif file_path.endswith('.txt'):
-            # Try different separators for text files
-            separators = [';', '\t', ',', ' ']
-            for sep in separators:
-                try:
-                    df = pd.read_csv(file_path, sep=sep)
-                    # Check if the separator resulted in multiple columns
-                    if len(df.columns) > 1:
-                        break
-                except:
-                    continue
-            else:
-                # If no separator worked, raise an error
-                raise ValueError("Could not determine the separator for the .txt file.")
+            # Sniff the dialect from the head of the file, then parse it once
+            if dialect is None:
+                dialect = detect_dialect(file_path)
         else:
             raise ValueError("Unsupported file type. Use .txt, .xlsx, or .csv files.")
-        
+
+        # Infer the compact schema from a sample so it is applied while parsing
+        sample = None
+        if optimize_dtypes:
+            sample = _read_sample(file_path, dialect, usecols=usecols, sheet_name=sheet_name)
+            dtype = {**infer_schema(sample), **(dtype or {})}
+
+        # The cache holds whole files; projection and filtering are applied when reading it
+        cache_options = {'dtype': dtype, 'optimize_dtypes': optimize_dtypes}
+        if file_path.endswith('.xlsx'):
+            cache_options['sheet_name'] = sheet_name
+        df = None
+        if use_cache:
+            df = load_cached(file_path, dialect, cache_dir, columns=usecols, predicate=predicate, **cache_options)
+        if df is not None:
+            df = _select(df, columns)
+            if progress is not None:
+                size = os.path.getsize(file_path)
+                progress(size, size)
+        else:
+            # Report progress by reading through a byte-counting handle
+            source = file_path
+            if progress is not None:
+                handle = io.BufferedReader(_ProgressFileIO(file_path, progress))
+                source = handle
+
+            if file_path.endswith('.xlsx'):
+                # Read only the selected sheet for Excel
+                df = _read_excel(source, sheet_name=sheet_name, dtype=dtype, usecols=usecols)
+                df = _select(df, columns, predicate)
+            elif predicate:
+                # Filter chunk by chunk so rows outside the predicate are never held together
+                with pd.read_csv(source, dtype=dtype, usecols=usecols, chunksize=DEFAULT_CHUNKSIZE,
+                                 **dialect) as reader:
+                    parts = [_select(chunk, columns, predicate) for chunk in reader]
+                df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=columns)
+            else:
+                df = pd.read_csv(source, dtype=dtype, usecols=usecols, **dialect)
+                df = _select(df, columns)
+            if optimize_dtypes:
+                df = downcast_floats(downcast_integers(df))
+            if use_cache and usecols is None and not predicate:
+                store_cached(df, file_path, dialect, cache_dir, **cache_options)
+
+        if optimize_dtypes:
+            df.attrs['memory_report'] = memory_report(sample, df)
+
+        if return_dialect:
+            return df, dialect
         return df
+    except ImportCancelled:
+        raise
     except Exception as e:
         raise ValueError(f"Error reading file: {str(e)}")
+    finally:
+        if handle is not None:
+            handle.close()
+
+def _is_glob(file_path):
+    """Whether a path is a glob pattern rather than an existing file."""
+    return glob.has_magic(file_path) and not os.path.exists(file_path)
+
+def _import_one(file_path, options):
+    """Import a single file in a worker process, returning the DataFrame and its dialect."""
+    return import_data(file_path, return_dialect=True, **options)
+
+def _check_schema(reference, df, file_path):
+    """Raise if a file's columns do not match the reference columns."""
+    missing = [col for col in reference if col not in df.columns]
+    extra = [col for col in df.columns if col not in reference]
+    if missing or extra:
+        raise ValueError(f"Columns of {file_path} do not match the first file: "
+                         f"missing {missing}, unexpected {extra}.")
+
+def _iter_files(file_paths, source_column, chunksize, dialects, options):
+    """Stream the chunks of several files one after another, tagged with their source."""
+    reference = None
+    for file_path, dialect in zip(file_paths, dialects):
+        for chunk in iter_data(file_path, chunksize=chunksize, dialect=dialect, **options):
+            if reference is None:
+                reference = list(chunk.columns)
+            _check_schema(reference, chunk, file_path)
+            chunk = chunk[reference]
+            chunk.insert(0, source_column, file_path)
+            yield chunk
+
+def import_files(file_paths, processes=None, source_column='source_file', return_dialect=False,
+                 chunksize=None, progress=None, **options):
+    """
+    Import several files in parallel and concatenate them into one DataFrame.
+    
+    Args:
+        file_paths (str or list of str): Paths of the data files, or a glob pattern.
+        processes (int, optional): Number of worker processes, defaults to the CPU count.
+        source_column (str): Name of the first column, recording the file each row came from.
+        return_dialect (bool): Whether to also return the list of dialects, one per file.
+        chunksize (int, optional): If given, return a generator streaming the chunks of each
+            file in turn instead of a DataFrame.
+        progress (callable, optional): Called as progress(bytes_done, total_bytes) after each
+            file is imported. It may raise ImportCancelled to abort the remaining files.
+        **options: Other import_data options, applied to every file.
+    
+    Returns:
+        pd.DataFrame: The concatenated data, with rows in file order. If return_dialect is
+            True, a (DataFrame, dialects) tuple is returned instead.
+    
+    Raises:
+        ValueError: If no file matches, a file cannot be read or the columns of the files differ.
+        ImportCancelled: If the progress callback cancelled the import.
+    """
+    if isinstance(file_paths, str):
+        file_paths = sorted(glob.glob(file_paths)) if _is_glob(file_paths) else [file_paths]
+    file_paths = list(file_paths)
+    if not file_paths:
+        raise ValueError("No files to import.")
+
+    if chunksize is not None:
+        streaming = {key: value for key, value in options.items() if key not in ('use_cache', 'cache_dir')}
+        dialect = streaming.pop('dialect', None)
+        streaming.pop('optimize_dtypes', None)
+        dialects = []
+        for file_path in file_paths:
+            if file_path.endswith('.txt'):
+                dialects.append(dialect or detect_dialect(file_path))
+            elif file_path.endswith('.csv'):
+                dialects.append(dict(CSV_DIALECT))
+            else:
+                dialects.append(None)
+        chunks = _iter_files(file_paths, source_column, chunksize, dialects, streaming)
+        if return_dialect:
+            return chunks, dialects
+        return chunks
+
+    sizes = [os.path.getsize(file_path) for file_path in file_paths]
+    total, done = sum(sizes), 0
+    results = [None] * len(file_paths)
+    if len(file_paths) == 1 or processes == 1:
+        for i, file_path in enumerate(file_paths):
+            results[i] = _import_one(file_path, options)
+            done += sizes[i]
+            if progress is not None:
+                progress(done, total)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = {executor.submit(_import_one, file_path, options): i for i, file_path in enumerate(file_paths)}
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i] = future.result()
+                    done += sizes[i]
+                    if progress is not None:
+                        progress(done, total)
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    reference = list(results[0][0].columns)
+    frames = []
+    for file_path, (df, _) in zip(file_paths, results):
+        _check_schema(reference, df, file_path)
+        frames.append(df[reference].assign(**{source_column: file_path}))
+    df = pd.concat(frames, ignore_index=True)
+    # One category per file instead of a string per row
+    df.insert(0, source_column, df.pop(source_column).astype('category'))
+    dialects = [dialect for _, dialect in results]
+    if return_dialect:
+        return df, dialects
+    return df
 
 def assign_column_names(df, has_headers=True, parent=None):
     """
@@ -60,6 +645,10 @@ def assign_column_names(df, has_headers=True, parent=None):
         # Use the first row as headers
         return df
     else:
+        # Imported here so headless imports of this module do not load Tk
+        import tkinter as tk
+        from tkinter import ttk
+
         # If no headers, prompt the user for custom column names via a dialog
         num_cols = len(df.columns)
         # Default column names
@@ -113,3 +702,45 @@ def assign_column_names(df, has_headers=True, parent=None):
         # Assign the custom names to the DataFrame
         df.columns = custom_names
         return df
+
+def choose_sheet(sheet_names, parent=None):
+    """
+    Ask the user which sheet of an Excel workbook to import.
+    
+    Args:
+        sheet_names (list of str): The sheet names of the workbook.
+        parent (tk.Tk or tk.Toplevel, optional): Parent window for the dialog.
+    
+    Returns:
+        str: The chosen sheet name.
+    
+    Raises:
+        ValueError: If the user cancels the dialog.
+    """
+    import tkinter as tk
+    from tkinter import ttk
+
+    dialog = tk.Toplevel(parent)
+    dialog.title("Select Sheet")
+    dialog.transient(parent)
+    dialog.grab_set()
+
+    ttk.Label(dialog, text="Sheet to import:").pack(padx=10, pady=5)
+    sheet = tk.StringVar(value=sheet_names[0])
+    sheet_menu = ttk.Combobox(dialog, textvariable=sheet, values=sheet_names, state="readonly")
+    sheet_menu.pack(fill="x", padx=10, pady=5)
+
+    confirmed = tk.BooleanVar(value=False)
+    button_frame = ttk.Frame(dialog)
+    button_frame.pack(fill="x", pady=10)
+    confirm_btn = ttk.Button(button_frame, text="Confirm",
+                             command=lambda: confirmed.set(True) or dialog.destroy())
+    confirm_btn.pack(side="right", padx=5)
+    cancel_btn = ttk.Button(button_frame, text="Cancel", command=lambda: dialog.destroy())
+    cancel_btn.pack(side="right", padx=5)
+
+    dialog.wait_window()
+
+    if not confirmed.get():
+        raise ValueError("Sheet selection was cancelled by the user.")
+    return sheet.get()
@@ -0,0 +1,189 @@
+from tkinter import ttk
+import numpy as np
+
+class VirtualTable(ttk.Frame):
+    """
+    Table widget that only materialises the rows currently on screen.
+
+    The Treeview holds a fixed pool of items whose values are overwritten from a
+    positional slice of the DataFrame whenever the view moves, so memory use and
+    redraw time do not depend on the number of rows in the data.
+    """
+
+    def __init__(self, master, row_height=20, **kwargs):
+        """
+        Create the table with its scrollbars and row navigation controls.
+
+        Args:
+            master (tk.Widget): Parent widget.
+            row_height (int): Height of one Treeview row in pixels, used to size the visible window.
+        """
+        super().__init__(master, **kwargs)
+        self.data = None  # DataFrame being displayed
+        self.order = None  # Row positions in sorted order, or None when unsorted
+        self.sort_column = None
+        self.sort_ascending = True
+        self.offset = 0  # Position of the first visible row
+        self.visible_rows = 1
+        self.row_height = row_height
+        self.items = []  # Pool of Treeview item ids reused for the visible window
+
+        # Row navigation
+        nav_frame = ttk.Frame(self)
+        nav_frame.pack(side="bottom", fill="x")
+        self.position_label = ttk.Label(nav_frame, text="")
+        self.position_label.pack(side="left")
+        go_btn = ttk.Button(nav_frame, text="Go", width=4, command=self._jump)
+        go_btn.pack(side="right")
+        self.row_entry = ttk.Entry(nav_frame, width=12)
+        self.row_entry.pack(side="right", padx=5)
+        self.row_entry.bind("<Return>", lambda event: self._jump())
+        ttk.Label(nav_frame, text="Go to row:").pack(side="right")
+
+        # Table with a virtual vertical scrollbar and a regular horizontal one
+        self.vscroll = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.vscroll.pack(side="right", fill="y")
+        self.hscroll = ttk.Scrollbar(self, orient="horizontal")
+        self.hscroll.pack(side="bottom", fill="x")
+        self.tree = ttk.Treeview(self, show="headings", xscrollcommand=self.hscroll.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.hscroll.config(command=self.tree.xview)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(3))
+        self.tree.bind("<Prior>", lambda event: self.scroll(-self.visible_rows))
+        self.tree.bind("<Next>", lambda event: self.scroll(self.visible_rows))
+
+    def set_data(self, data):
+        """
+        Display a new DataFrame, keeping the current position and sort column when possible.
+
+        Args:
+            data (pd.DataFrame): The data to display.
+        """
+        columns_changed = self.data is None or list(self.data.columns) != list(data.columns)
+        self.data = data
+        if columns_changed:
+            self.tree["columns"] = list(range(len(data.columns)))
+            for i, col in enumerate(data.columns):
+                self.tree.column(i, width=100, stretch=False)
+        if self.sort_column not in data.columns:
+            self.sort_column = None
+        self._update_order()
+        self._update_headings()
+        self.show_row(self.offset)
+
+    def sort_by(self, column):
+        """
+        Sort the displayed rows by a column, toggling the direction on repeated calls.
+
+        Args:
+            column: Name of the column to sort by.
+        """
+        if self.data is None:
+            return
+        if self.sort_column == column:
+            self.sort_ascending = not self.sort_ascending
+        else:
+            self.sort_column = column
+            self.sort_ascending = True
+        self._update_order()
+        self._update_headings()
+        self.show_row(0)
+
+    def show_row(self, offset):
+        """
+        Scroll so that the row at the given position is the first visible one.
+
+        Args:
+            offset (int): Position of the row in the (sorted) table.
+        """
+        if self.data is None:
+            return
+        n_rows = len(self.data)
+        self.offset = max(0, min(int(offset), n_rows - self.visible_rows))
+        self.refresh()
+
+    def scroll(self, rows):
+        """Move the visible window by a number of rows."""
+        self.show_row(self.offset + rows)
+
+    def refresh(self):
+        """Redraw the visible window from the DataFrame."""
+        if self.data is None:
+            return
+        n_rows = len(self.data)
+        stop = min(self.offset + self.visible_rows, n_rows)
+        if self.order is None:
+            window = self.data.iloc[self.offset:stop]
+        else:
+            window = self.data.iloc[self.order[self.offset:stop]]
+        values = window.to_numpy(dtype=object).tolist()
+
+        # Reuse the pooled items, growing or shrinking the pool only when the window size changes
+        while len(self.items) < len(values):
+            self.items.append(self.tree.insert("", "end"))
+        while len(self.items) > len(values):
+            self.tree.delete(self.items.pop())
+        for item, row in zip(self.items, values):
+            self.tree.item(item, values=row)
+
+        if n_rows:
+            self.vscroll.set(self.offset / n_rows, stop / n_rows)
+            self.position_label.config(text=f"Rows {self.offset + 1}-{stop} of {n_rows}")
+        else:
+            self.vscroll.set(0, 1)
+            self.position_label.config(text="No rows")
+
+    def _update_order(self):
+        """Compute the row permutation for the current sort column."""
+        if self.sort_column is None:
+            self.order = None
+            return
+        column = self.data[self.sort_column].reset_index(drop=True)
+        try:
+            ordered = column.sort_values(ascending=self.sort_ascending, kind="stable", na_position="last")
+        except TypeError:
+            # Mixed types cannot be compared directly, so fall back to their text form
+            ordered = column.astype(str).sort_values(ascending=self.sort_ascending, kind="stable")
+        self.order = ordered.index.to_numpy(dtype=np.intp)
+
+    def _update_headings(self):
+        """Show column names with a marker on the sort column."""
+        for i, col in enumerate(self.data.columns):
+            text = str(col)
+            if col == self.sort_column:
+                text += " ▲" if self.sort_ascending else " ▼"
+            self.tree.heading(i, text=text, command=lambda c=col: self.sort_by(c))
+
+    def _jump(self):
+        """Jump to the row number typed in the navigation entry."""
+        try:
+            row = int(self.row_entry.get())
+        except ValueError:
+            return
+        self.show_row(row - 1)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """Translate scrollbar commands into row offsets."""
+        if self.data is None:
+            return
+        if action == "moveto":
+            self.show_row(float(amount) * len(self.data))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch."""
+        self.scroll(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _on_resize(self, event):
+        """Resize the visible window to the rows that fit in the widget."""
+        visible_rows = max(1, (event.height - self.row_height) // self.row_height)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.show_row(self.offset)
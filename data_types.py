@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+
+# Number of rows read to infer the schema of a file
+DTYPE_SAMPLE_ROWS = 10_000
+
+# Text columns with at most this ratio of unique values in the sample become categoricals
+CATEGORY_RATIO = 0.5
+
+# Significant decimal digits float32 always preserves
+FLOAT32_DIGITS = np.finfo(np.float32).precision
+
+def _string_dtype():
+    """Arrow-backed strings when pyarrow is available, plain objects otherwise."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    return 'string[pyarrow]'
+
+def infer_schema(sample, category_ratio=CATEGORY_RATIO):
+    """
+    Infer compact parse-time dtypes from a sample of a file.
+
+    Low-cardinality text becomes category and other text Arrow-backed strings.
+    Numeric columns are left out: a narrow dtype given to the parser silently wraps
+    or rounds values the sample did not show, so they are downcast after parsing
+    instead (see downcast_integers and downcast_floats).
+
+    Args:
+        sample (pd.DataFrame): The first rows of the file parsed with default dtypes.
+        category_ratio (float): Maximum ratio of unique to total values for a categorical column.
+
+    Returns:
+        dict: Mapping of column name to dtype, suitable for the dtype argument of the readers.
+    """
+    schema = {}
+    string_dtype = _string_dtype()
+    for col in sample.columns:
+        series = sample[col]
+        if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            values = series.dropna()
+            if len(values) and values.nunique() <= category_ratio * len(values):
+                schema[col] = 'category'
+            elif string_dtype is not None and pd.api.types.is_object_dtype(series):
+                # Text already parsed into a string dtype is left as is
+                schema[col] = string_dtype
+    return schema
+
+def downcast_integers(df):
+    """
+    Downcast int64 columns in place to the narrowest integer dtype holding their values.
+
+    Args:
+        df (pd.DataFrame): The parsed data.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with narrower integer columns.
+    """
+    for col in df.columns:
+        if pd.api.types.is_integer_dtype(df[col]) and df[col].dtype.itemsize > 1:
+            signed = pd.api.types.is_signed_integer_dtype(df[col])
+            df[col] = pd.to_numeric(df[col], downcast='integer' if signed else 'unsigned')
+    return df
+
+def _fits_float32(values, digits):
+    """Whether every finite value has at most digits significant decimal digits and lies in float32's range."""
+    finite = values[np.isfinite(values) & (values != 0)]
+    if not len(finite):
+        return True
+    magnitude = np.abs(finite)
+    info = np.finfo(np.float32)
+    if magnitude.min() < info.tiny or magnitude.max() > info.max:
+        return False
+    # Shift each value so its last allowed digit is in the units place; anything left
+    # after the decimal point is a further digit (a whole tenth or more)
+    scaled = finite * 10.0 ** (digits - 1 - np.floor(np.log10(magnitude)))
+    return bool(np.all(np.abs(scaled - np.round(scaled)) < 1e-3))
+
+def downcast_floats(df, digits=FLOAT32_DIGITS):
+    """
+    Downcast float64 columns in place to float32 where no written digit is lost.
+
+    A column is narrowed when every value has at most digits significant decimal
+    digits, as in sensor readings such as 23.7 or 0.1, and fits float32's range.
+    float32 stores those values to within rounding and gives back the same digits
+    when printed with that precision. Columns with longer values, e.g. epoch
+    timestamps or computed results, stay float64.
+
+    Args:
+        df (pd.DataFrame): The parsed data.
+        digits (int): Largest number of significant digits of a narrowed column, at
+            most FLOAT32_DIGITS for the values to be preserved.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with narrower float columns.
+    """
+    for col in df.columns:
+        if df[col].dtype == np.float64 and _fits_float32(df[col].to_numpy(), digits):
+            df[col] = df[col].astype(np.float32)
+    return df
+
+def memory_report(sample, df):
+    """
+    Compare per-column memory of the default dtypes with the optimised ones.
+
+    The default cost is extrapolated from the per-row memory of the sample parsed
+    with default dtypes, so the full file never has to be parsed twice.
+
+    Args:
+        sample (pd.DataFrame): The first rows of the file parsed with default dtypes.
+        df (pd.DataFrame): The full data parsed with the optimised schema.
+
+    Returns:
+        dict: Mapping of column name to dtype_before, dtype_after, bytes_before and bytes_after.
+    """
+    report = {}
+    rows = max(len(sample), 1)
+    before = sample.memory_usage(index=False, deep=True)
+    after = df.memory_usage(index=False, deep=True)
+    for col in df.columns:
+        report[col] = {
+            'dtype_before': str(sample[col].dtype) if col in sample.columns else None,
+            'dtype_after': str(df[col].dtype),
+            'bytes_before': int(before.get(col, 0) / rows * len(df)),
+            'bytes_after': int(after[col]),
+        }
+    return report
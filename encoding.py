@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+
+# Number of buckets of the hashing encoder
+DEFAULT_HASH_BUCKETS = 32
+
+# Weight of the overall target mean in the target encoding of a category, in rows
+DEFAULT_SMOOTHING = 10.0
+
+def _codes(series):
+    """
+    Integer codes of a column and the distinct values they stand for, -1 for missing values.
+
+    Categorical columns already hold their codes, so only other columns are hashed.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    return pd.factorize(series)
+
+def _vocabulary_codes(series, vocabulary):
+    """
+    Codes of a column's values in a fitted vocabulary, -1 for missing or unseen values.
+
+    Only the distinct values of the column are looked up in the vocabulary; the rows
+    are then mapped through that small lookup table.
+    """
+    codes, uniques = _codes(series)
+    # The appended -1 is picked up by the -1 codes of missing values
+    lookup = np.append(pd.Index(vocabulary).get_indexer(uniques), -1)
+    return lookup[codes]
+
+def _code_dtype(size):
+    """Narrowest signed integer dtype holding codes from -1 to size - 1."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if size <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+def _sorted(uniques):
+    """Distinct values in sorted order when they are comparable, else as found."""
+    try:
+        return uniques.sort_values()
+    except TypeError:
+        return uniques
+
+class OrdinalEncoder:
+    """Replace each category with its position in the sorted vocabulary."""
+
+    method = 'ordinal'
+
+    def __init__(self, categories=None):
+        self.categories = categories
+
+    def fit(self, series, target=None):
+        codes, uniques = _codes(series)
+        self.categories = _sorted(uniques).tolist()
+        return self
+
+    def transform(self, series, name):
+        """
+        Encode a column.
+
+        Args:
+            series (pd.Series): Values to encode, e.g. a chunk of the data.
+            name (str): Name of the encoded column.
+
+        Returns:
+            dict: Mapping of output column name to values.
+        """
+        codes = _vocabulary_codes(series, self.categories)
+        return {name: codes.astype(_code_dtype(len(self.categories)))}
+
+    def to_dict(self):
+        return {'method': self.method, 'categories': self.categories}
+
+class OneHotEncoder(OrdinalEncoder):
+    """Replace a column with one sparse 0/1 indicator column per category."""
+
+    method = 'onehot'
+
+    def transform_matrix(self, series):
+        """
+        Encode a column as a sparse matrix with one row per value and one column per category.
+
+        Args:
+            series (pd.Series): Values to encode.
+
+        Returns:
+            scipy.sparse.csr_matrix: The indicators, uint8.
+
+        Raises:
+            ValueError: If scipy is not installed.
+        """
+        try:
+            from scipy import sparse
+        except ImportError:
+            raise ValueError("One-hot matrix output requires scipy.")
+        codes = _vocabulary_codes(series, self.categories)
+        rows = np.flatnonzero(codes >= 0)
+        data = np.ones(len(rows), dtype=np.uint8)
+        return sparse.csr_matrix((data, (rows, codes[rows])), shape=(len(codes), len(self.categories)))
+
+    def transform(self, series, name):
+        names = [f"{name}_{category}" for category in self.categories]
+        try:
+            matrix = self.transform_matrix(series)
+        except ValueError:
+            # Without scipy every indicator is sparsified from a dense comparison
+            codes = _vocabulary_codes(series, self.categories)
+            return {col: pd.arrays.SparseArray((codes == i).view(np.uint8), fill_value=0)
+                    for i, col in enumerate(names)}
+        frame = pd.DataFrame.sparse.from_spmatrix(matrix.tocsc(), columns=names)
+        return {col: frame[col].array for col in names}
+
+class HashingEncoder:
+    """Replace each category with a stable hash bucket, without storing a vocabulary."""
+
+    method = 'hashing'
+
+    def __init__(self, n_features=DEFAULT_HASH_BUCKETS):
+        self.n_features = n_features
+
+    def fit(self, series, target=None):
+        return self
+
+    def transform(self, series, name):
+        codes, uniques = _codes(series)
+        # Hashing the text of each distinct value keeps buckets equal across dtypes and runs
+        hashes = pd.util.hash_array(np.asarray(uniques.astype(str), dtype=object))
+        lookup = np.append((hashes % np.uint64(self.n_features)).astype(np.int64), -1)
+        return {name: lookup[codes].astype(_code_dtype(self.n_features))}
+
+    def to_dict(self):
+        return {'method': self.method, 'n_features': self.n_features}
+
+class TargetEncoder:
+    """
+    Replace each category with the smoothed mean of a numeric target over its rows.
+
+    A category seen in n rows is encoded as (sum of its targets + smoothing * prior) /
+    (n + smoothing), where prior is the overall target mean; unseen and missing values
+    get the prior.
+    """
+
+    method = 'target'
+
+    def __init__(self, categories=None, values=None, prior=None, smoothing=DEFAULT_SMOOTHING):
+        self.categories = categories
+        self.values = values
+        self.prior = prior
+        self.smoothing = smoothing
+
+    def fit(self, series, target=None):
+        if target is None or not pd.api.types.is_numeric_dtype(target):
+            raise ValueError("Target encoding requires a numeric target column.")
+        codes, uniques = _codes(series)
+        target = target.to_numpy(dtype=float, na_value=np.nan)
+        valid = (codes >= 0) & ~np.isnan(target)
+        sums = np.bincount(codes[valid], weights=target[valid], minlength=len(uniques))
+        counts = np.bincount(codes[valid], minlength=len(uniques))
+        self.prior = float(target[valid].mean()) if valid.any() else 0.0
+        self.categories = uniques.tolist()
+        self.values = ((sums + self.smoothing * self.prior) / (counts + self.smoothing)).tolist()
+        return self
+
+    def transform(self, series, name):
+        codes = _vocabulary_codes(series, self.categories)
+        lookup = np.append(np.asarray(self.values, dtype=float), self.prior)
+        return {name: lookup[codes]}
+
+    def to_dict(self):
+        return {'method': self.method, 'categories': self.categories, 'values': self.values,
+                'prior': self.prior, 'smoothing': self.smoothing}
+
+# Encoder class of each encoding method
+ENCODERS = {
+    'ordinal': OrdinalEncoder,
+    'onehot': OneHotEncoder,
+    'hashing': HashingEncoder,
+    'target': TargetEncoder,
+}
+
+def encoder_from_dict(state):
+    """
+    Rebuild a fitted encoder from the state stored in a method.
+
+    Args:
+        state (dict): The output of the encoder's to_dict.
+
+    Returns:
+        The encoder.
+
+    Raises:
+        ValueError: If the encoding method is unknown.
+    """
+    options = dict(state)
+    method = options.pop('method', None)
+    if method not in ENCODERS:
+        raise ValueError(f"Unknown encoding method: {method}")
+    return ENCODERS[method](**options)
+
+def categorical_columns(df):
+    """Text and categorical columns of a DataFrame."""
+    return [col for col in df.columns
+            if isinstance(df[col].dtype, pd.CategoricalDtype)
+            or pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col])]
+
+def fit_encoders(df, columns=None, method='ordinal', target=None, n_features=DEFAULT_HASH_BUCKETS,
+                 smoothing=DEFAULT_SMOOTHING):
+    """
+    Fit one encoder per column and return their JSON-serialisable state.
+
+    The state is stored in the method's encode step, so the same vocabularies are
+    applied when the method is replayed on new data or on chunks of a large file.
+
+    Args:
+        df (pd.DataFrame): The data to fit on.
+        columns (list, optional): Columns to encode, defaults to all text and categorical columns.
+        method (str): 'ordinal', 'onehot', 'hashing' or 'target'.
+        target (str, optional): Numeric target column for method 'target'.
+        n_features (int): Number of buckets for method 'hashing'.
+        smoothing (float): Smoothing weight for method 'target'.
+
+    Returns:
+        dict: Mapping of column name to fitted encoder state.
+
+    Raises:
+        ValueError: If the method is unknown or a column does not exist.
+    """
+    if method not in ENCODERS:
+        raise ValueError(f"Unknown encoding method: {method}")
+    if columns is None:
+        columns = [col for col in categorical_columns(df) if col != target]
+    options = {'hashing': {'n_features': n_features}, 'target': {'smoothing': smoothing}}.get(method, {})
+    target_values = None
+    if method == 'target':
+        if target not in df.columns:
+            raise ValueError(f"Unknown target column: {target}")
+        target_values = df[target]
+    encoders = {}
+    for col in columns:
+        if col not in df.columns:
+            raise ValueError(f"Unknown column: {col}")
+        encoders[col] = ENCODERS[method](**options).fit(df[col], target_values).to_dict()
+    return encoders
@@ -0,0 +1,39 @@
+from .method_storage import save_method
+
+def export_plot(fig, file_path):
+    """
+    Export a matplotlib figure to an image file.
+    
+    Args:
+        fig (matplotlib.figure.Figure): The figure to export.
+        file_path (str): Path of the image file; the format follows its extension.
+    """
+    fig.savefig(file_path, bbox_inches='tight')
+
+def export_data(df, file_path):
+    """
+    Export a DataFrame to a file based on its extension.
+    
+    Args:
+        df (pd.DataFrame): The data to export.
+        file_path (str): Path of the .csv or .xlsx file to write.
+    
+    Raises:
+        ValueError: If the file type is unsupported.
+    """
+    if file_path.endswith('.csv'):
+        df.to_csv(file_path, index=False)
+    elif file_path.endswith('.xlsx'):
+        df.to_excel(file_path, index=False)
+    else:
+        raise ValueError("Unsupported file type. Use .csv or .xlsx files.")
+
+def export_method(config, file_path):
+    """
+    Export a method configuration to a JSON file.
+    
+    Args:
+        config (dict): The method configuration.
+        file_path (str): Path of the JSON file to write.
+    """
+    save_method(config, file_path)
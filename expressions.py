@@ -0,0 +1,427 @@
+import ast
+import copy
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
+
+# Functions usable in expressions and their NumPy implementations
+FUNCTIONS = {
+    'abs': np.abs,
+    'sqrt': np.sqrt,
+    'exp': np.exp,
+    'expm1': np.expm1,
+    'log': np.log,
+    'log10': np.log10,
+    'log2': np.log2,
+    'log1p': np.log1p,
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'arcsin': np.arcsin,
+    'arccos': np.arccos,
+    'arctan': np.arctan,
+    'arctan2': np.arctan2,
+    'sinh': np.sinh,
+    'cosh': np.cosh,
+    'tanh': np.tanh,
+    'arcsinh': np.arcsinh,
+    'arccosh': np.arccosh,
+    'arctanh': np.arctanh,
+    'floor': np.floor,
+    'ceil': np.ceil,
+    'minimum': np.minimum,
+    'maximum': np.maximum,
+    'where': np.where,
+}
+
+# Constants usable in expressions
+CONSTANTS = {'pi': np.pi, 'e': np.e, 'nan': np.nan, 'inf': np.inf}
+
+# Subset of FUNCTIONS that numexpr can evaluate
+NUMEXPR_FUNCTIONS = {
+    'abs', 'sqrt', 'exp', 'expm1', 'log', 'log10', 'log1p', 'sin', 'cos', 'tan', 'arcsin', 'arccos',
+    'arctan', 'arctan2', 'sinh', 'cosh', 'tanh', 'arcsinh', 'arccosh', 'arctanh', 'where',
+}
+
+# Syntax allowed in expressions
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd, ast.Invert, ast.BitAnd, ast.BitOr, ast.BitXor,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+# Row count above which evaluation is spread over threads
+PARALLEL_ROWS = 1_000_000
+
+# Rows per block when a script is evaluated in one fused pass, sized so a block's
+# intermediates stay in CPU cache
+BLOCK_ROWS = 65_536
+
+# Syntax nodes that are worth hoisting when they occur more than once in a script
+_SUBEXPRESSION_NODES = (ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call)
+
+_ASSIGNMENT = re.compile(r'^\s*(`[^`]+`|[A-Za-z_]\w*)\s*=(?!=)(.*)$', re.DOTALL)
+_BACKTICK = re.compile(r'`([^`]+)`')
+
+class CompiledExpression:
+    """
+    An assignment expression parsed and validated once, evaluated over whole columns.
+
+    Column references are bound to positional variables (_c0, _c1, ...) so the same
+    compiled expression can be evaluated against any DataFrame with those columns.
+    """
+
+    def __init__(self, target, tree, columns, source):
+        self.target = target  # Name of the column being assigned
+        self.columns = columns  # Columns read by the expression, in variable order
+        self.source = source  # Expression text with columns replaced by variables
+        self.code = compile(tree, '<expression>', 'eval')
+        self.numexpr = _numexpr_compatible(tree)
+        if self.numexpr:
+            # numexpr reads integer literals as int32; bound as int64 variables they
+            # combine with the columns as they do in NumPy
+            literals = _LiteralBinder()
+            self.numexpr_source = ast.unparse(literals.visit(copy.deepcopy(tree)))
+            self.literals = literals.values
+
+    def evaluate(self, df):
+        """
+        Evaluate the expression over the columns of a DataFrame.
+
+        Args:
+            df (pd.DataFrame): The data providing the referenced columns.
+
+        Returns:
+            np.ndarray: The computed values, one per row.
+        """
+        missing = [col for col in self.columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Unknown column(s) in expression: {missing}")
+        arrays = {f"_c{i}": _column_values(df[col]) for i, col in enumerate(self.columns)}
+        n_rows = len(df)
+        if self.numexpr and n_rows >= 10_000:
+            try:
+                import numexpr
+            except ImportError:
+                pass
+            else:
+                # numexpr evaluates in blocks over its own thread pool. Its type rules
+                # differ from NumPy's (abs of integers is float, bool arithmetic is
+                # integer), so the result takes the dtype NumPy gives on empty columns;
+                # NumPy also raises first where it rejects the expression (e.g. bool - bool).
+                dtype = np.asarray(self._evaluate_numpy({name: a[:0] for name, a in arrays.items()})).dtype
+                values = numexpr.evaluate(self.numexpr_source, local_dict={**arrays, **self.literals})
+                return _broadcast(values.astype(dtype, copy=False), n_rows)
+        if n_rows >= PARALLEL_ROWS and arrays:
+            return _broadcast(self._evaluate_threaded(arrays, n_rows), n_rows)
+        return _broadcast(self._evaluate_numpy(arrays), n_rows)
+
+    def _evaluate_numpy(self, arrays):
+        """Evaluate with NumPy ufuncs."""
+        namespace = {'__builtins__': {}, **FUNCTIONS, **CONSTANTS, **arrays}
+        with np.errstate(all='ignore'):
+            return eval(self.code, namespace)
+
+    def _evaluate_threaded(self, arrays, n_rows):
+        """Evaluate row blocks on threads; NumPy ufuncs release the GIL."""
+        workers = os.cpu_count() or 1
+        bounds = np.linspace(0, n_rows, workers + 1, dtype=np.int64)
+        blocks = [{name: values[start:stop] for name, values in arrays.items()}
+                  for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return np.concatenate(list(executor.map(self._evaluate_numpy, blocks)))
+
+class CompiledScript:
+    """
+    A batch of assignments compiled into one straight-line program.
+
+    Every assignment gets its own variable (a later assignment to the same column
+    gets a new one), repeated subexpressions are computed once into temporaries, and
+    assignments whose result is overwritten before being read are dropped. The
+    program runs over blocks of rows, so all intermediates of a block stay small
+    and only the final columns are allocated at full length.
+    """
+
+    def __init__(self, columns, operations, outputs):
+        self.columns = columns  # Input columns, in variable order
+        self.operations = operations  # (variable, code) pairs in execution order
+        self.outputs = outputs  # Assigned column name -> variable holding its final value
+
+    def evaluate(self, df):
+        """
+        Run the script over the columns of a DataFrame.
+
+        Args:
+            df (pd.DataFrame): The data providing the referenced columns.
+
+        Returns:
+            dict: Mapping of each assigned column name to its computed values.
+        """
+        missing = [col for col in self.columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Unknown column(s) in expression: {missing}")
+        arrays = {f"_c{i}": _column_values(df[col]) for i, col in enumerate(self.columns)}
+        n_rows = len(df)
+        bounds = list(range(0, n_rows, BLOCK_ROWS)) + [n_rows]
+        blocks = list(zip(bounds[:-1], bounds[1:])) or [(0, 0)]
+
+        # The first block fixes the output dtypes; the rest write into preallocated columns
+        first = self._evaluate_block(arrays, *blocks[0])
+        results = {}
+        for name, values in first.items():
+            results[name] = np.empty(n_rows, dtype=values.dtype)
+            results[name][:len(values)] = values
+
+        def run(block):
+            start, stop = block
+            for name, values in self._evaluate_block(arrays, start, stop).items():
+                results[name][start:stop] = values
+
+        if n_rows >= PARALLEL_ROWS:
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                list(executor.map(run, blocks[1:]))
+        else:
+            for block in blocks[1:]:
+                run(block)
+        return results
+
+    def _evaluate_block(self, arrays, start, stop):
+        """Run every operation on one block of rows."""
+        namespace = {'__builtins__': {}, **FUNCTIONS, **CONSTANTS}
+        namespace.update({name: values[start:stop] for name, values in arrays.items()})
+        with np.errstate(all='ignore'):
+            for variable, code in self.operations:
+                namespace[variable] = eval(code, namespace)
+        return {column: _broadcast(namespace[variable], stop - start)
+                for column, variable in self.outputs.items()}
+
+def _column_values(series):
+    """
+    NumPy values of a column, converting nullable and text columns to float.
+
+    Narrow integers are widened to int64 and float32 to float64. NumPy keeps the
+    narrow dtype (int8 * 3 wraps around) while numexpr upcasts, so without this
+    the result would depend on the number of rows and could overflow.
+    """
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biuf':
+        if series.dtype.kind in 'iu' and series.dtype.itemsize < 8:
+            return series.to_numpy(dtype=np.int64)
+        if series.dtype.kind == 'f' and series.dtype.itemsize < 8:
+            return series.to_numpy(dtype=np.float64)
+        return series.to_numpy()
+    try:
+        return series.to_numpy(dtype='float64', na_value=np.nan)
+    except (TypeError, ValueError):
+        raise ValueError(f"Column {series.name!r} is not numeric.")
+
+def _broadcast(values, n_rows):
+    """Expand a scalar result to a full column."""
+    values = np.asarray(values)
+    if values.ndim == 0:
+        return np.full(n_rows, values[()])
+    return values
+
+def _numexpr_compatible(tree):
+    """Whether numexpr supports every function and operator in the expression."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and node.func.id not in NUMEXPR_FUNCTIONS:
+            return False
+        if isinstance(node, (ast.FloorDiv, ast.BitXor, ast.Invert)):
+            return False
+        if isinstance(node, ast.Name) and node.id in CONSTANTS:
+            return False
+    return True
+
+class _ColumnBinder(ast.NodeTransformer):
+    """Validate the syntax tree and replace column names with positional variables."""
+
+    def __init__(self, aliases, columns=None, targets=None):
+        self.aliases = aliases  # Placeholder names of backtick-quoted columns
+        self.columns = [] if columns is None else columns
+        self.targets = targets or {}  # Variables holding columns assigned earlier in a script
+
+    def generic_visit(self, node):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported syntax in expression: {type(node).__name__}")
+        return super().generic_visit(node)
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            name = node.func.id if isinstance(node.func, ast.Name) else ast.unparse(node.func)
+            raise ValueError(f"Unknown function in expression: {name}")
+        if node.keywords:
+            raise ValueError("Keyword arguments are not supported in expressions.")
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    def visit_Constant(self, node):
+        if not isinstance(node.value, (int, float, bool)):
+            raise ValueError(f"Unsupported constant in expression: {node.value!r}")
+        return node
+
+    def visit_Name(self, node):
+        if node.id in CONSTANTS and node.id not in self.aliases:
+            return node
+        column = self.aliases.get(node.id, node.id)
+        if column in self.targets:
+            return ast.copy_location(ast.Name(id=self.targets[column], ctx=ast.Load()), node)
+        if column not in self.columns:
+            self.columns.append(column)
+        return ast.copy_location(ast.Name(id=f"_c{self.columns.index(column)}", ctx=ast.Load()), node)
+
+class _LiteralBinder(ast.NodeTransformer):
+    """Replace integer literals with int64 variables (_k0, _k1, ...) for numexpr."""
+
+    def __init__(self):
+        self.values = {}
+
+    def visit_Constant(self, node):
+        if type(node.value) is not int or not -2 ** 63 <= node.value < 2 ** 63:
+            return node
+        name = f"_k{len(self.values)}"
+        self.values[name] = np.int64(node.value)
+        return ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node)
+
+def _parse_assignment(expression):
+    """Split an assignment into its target and the parsed syntax tree of its right-hand side."""
+    match = _ASSIGNMENT.match(expression)
+    if match is None:
+        raise ValueError("Expression must be an assignment, e.g. new_col = log10(col1 * 3 + 1).")
+    target, body = match.group(1).strip('`'), match.group(2)
+
+    # Backtick-quoted column names become placeholder identifiers before parsing
+    aliases = {}
+    def alias(quoted):
+        name = f"_quoted{len(aliases)}"
+        aliases[name] = quoted.group(1)
+        return name
+    body = _BACKTICK.sub(alias, body)
+
+    try:
+        tree = ast.parse(body.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression syntax: {e.msg}")
+    return target, tree, aliases
+
+@lru_cache(maxsize=256)
+def compile_expression(expression):
+    """
+    Parse, validate and compile an assignment such as "new_col = log10(col1 * 3 + 1)".
+
+    Column names that are not Python identifiers can be quoted with backticks. Results
+    are cached, so re-applying a saved method only pays for the arithmetic.
+
+    Args:
+        expression (str): The assignment expression.
+
+    Returns:
+        CompiledExpression: The compiled expression.
+
+    Raises:
+        ValueError: If the expression is not an assignment or uses unsupported syntax.
+    """
+    target, tree, aliases = _parse_assignment(expression)
+    binder = _ColumnBinder(aliases)
+    tree = ast.fix_missing_locations(binder.visit(tree))
+    return CompiledExpression(target, tree, binder.columns, ast.unparse(tree))
+
+class _SubexpressionHoister:
+    """Replace subexpressions that occur more than once with shared temporaries."""
+
+    def __init__(self, repeated):
+        self.repeated = repeated  # Dumps of the subexpressions occurring more than once
+        self.temporaries = {}  # Subexpression dump -> temporary variable
+        self.operations = []  # New (variable, tree) pairs for the statement being hoisted
+
+    def hoist(self, node):
+        key = ast.dump(node)
+        if key in self.temporaries:
+            return ast.Name(id=self.temporaries[key], ctx=ast.Load())
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                setattr(node, field, [self.hoist(item) if isinstance(item, ast.expr) else item
+                                      for item in value])
+            elif isinstance(value, ast.expr) and not (isinstance(node, ast.Call) and field == 'func'):
+                setattr(node, field, self.hoist(value))
+        if key in self.repeated:
+            variable = f"_t{len(self.temporaries)}"
+            self.temporaries[key] = variable
+            self.operations.append((variable, node))
+            return ast.Name(id=variable, ctx=ast.Load())
+        return node
+
+def _referenced(tree):
+    """Names of the variables read by a syntax tree."""
+    return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+
+def split_statements(script):
+    """
+    Split a transformation script into its assignments.
+
+    Args:
+        script (str): Assignments separated by newlines or semicolons.
+
+    Returns:
+        list of str: The non-empty assignments, in order.
+    """
+    return [statement.strip() for statement in re.split(r'[;\n]', script) if statement.strip()]
+
+@lru_cache(maxsize=64)
+def compile_script(script):
+    """
+    Compile a batch of assignments, such as one per line, into a single fused program.
+
+    Later assignments may read columns created by earlier ones. Shared subexpressions
+    are evaluated once and assignments that are overwritten before use are skipped.
+
+    Args:
+        script (str): Assignments separated by newlines or semicolons.
+
+    Returns:
+        CompiledScript: The compiled script.
+
+    Raises:
+        ValueError: If a statement is not an assignment or uses unsupported syntax.
+    """
+    statements = split_statements(script)
+    if not statements:
+        raise ValueError("Expression must be an assignment, e.g. new_col = log10(col1 * 3 + 1).")
+
+    # Bind names: columns to inputs, earlier targets to the variable of their latest assignment
+    columns, targets, bound = [], {}, []
+    for i, statement in enumerate(statements):
+        target, tree, aliases = _parse_assignment(statement)
+        binder = _ColumnBinder(aliases, columns, targets)
+        tree = binder.visit(tree)
+        variable = f"_v{i}"
+        bound.append((variable, tree.body))
+        targets = {**targets, target: variable}
+
+    # Eliminate common subexpressions across all statements
+    counts = {}
+    for _, node in bound:
+        for sub in ast.walk(node):
+            if isinstance(sub, _SUBEXPRESSION_NODES):
+                key = ast.dump(sub)
+                counts[key] = counts.get(key, 0) + 1
+    hoister = _SubexpressionHoister({key for key, count in counts.items() if count > 1})
+    program = []
+    for variable, node in bound:
+        hoister.operations = []
+        node = hoister.hoist(node)
+        program.extend(hoister.operations)
+        program.append((variable, node))
+
+    # Keep only the operations the final columns depend on
+    live = set(targets.values())
+    operations = []
+    for variable, node in reversed(program):
+        if variable in live:
+            live |= _referenced(node)
+            tree = ast.fix_missing_locations(ast.Expression(body=node))
+            operations.append((variable, compile(tree, '<script>', 'eval')))
+    operations.reverse()
+    return CompiledScript(columns, operations, targets)
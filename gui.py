@@ -1,9 +1,16 @@
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog
+from tkinter import messagebox
 import pandas as pd
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from .data_table import VirtualTable
+from .history import DataHistory
+from .rendering import RenderWorker
+from .step_cache import StepCache
 
 class MainGUI:
     def __init__(self, master):
@@ -16,6 +23,17 @@ class MainGUI:
         self.data = None  # Holds the current DataFrame
         self.model = None  # Holds the trained model
         self.config = {}  # Holds method configurations
+        self.history = DataHistory()  # Undo/redo versions of self.data
+        self.step_cache = StepCache()  # Memoised results of method steps
+        self.rendered_plot = None  # Return value of the last background plot, e.g. an LODLine
+        self.dist_plot = None  # Distribution plot reusing its artists between columns
+        self.render_worker = RenderWorker()  # Draws heavy plots off the Tk thread
+        self.render_message = ""  # Message shown once the background render is displayed
+        self.import_thread = None  # Worker thread loading a file
+        self.import_cancel = threading.Event()  # Set to abort the running import
+        self.import_queue = queue.Queue()  # Hands the loaded data back to the Tk loop
+        self.import_fraction = 0.0  # Fraction of the file consumed by the worker
+        self.import_sheet = 0  # Excel sheet of the running import
 
         # Create the notebook (tabbed interface) at the top
         self.notebook = ttk.Notebook(self.master)
@@ -29,9 +47,10 @@ class MainGUI:
         left_frame = ttk.Frame(self.paned_window)
         self.paned_window.add(left_frame, weight=1)
 
-        # Data table
-        self.data_tree = ttk.Treeview(left_frame, show="headings")
-        self.data_tree.pack(fill="both", expand=True, padx=10, pady=10)
+        # Data table, only the visible rows are loaded into the Treeview
+        self.data_table = VirtualTable(left_frame)
+        self.data_table.pack(fill="both", expand=True, padx=10, pady=10)
+        self.data_tree = self.data_table.tree
 
         # Message label
         self.message_label = tk.Label(left_frame, text="", anchor="w", justify="left", bg="#f0f0f0")
@@ -43,6 +62,9 @@ class MainGUI:
 
         self.fig, self.ax = plt.subplots()
         self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)
+        # Zoom and pan; density plots re-aggregate the visible region when the view changes
+        self.toolbar = NavigationToolbar2Tk(self.canvas, right_frame, pack_toolbar=False)
+        self.toolbar.pack(side="bottom", fill="x")
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
         # Initialize all tabs
@@ -60,46 +82,123 @@ class MainGUI:
         tab = ttk.Frame(self.notebook)
         self.notebook.add(tab, text="Import Data")
 
-        import_btn = ttk.Button(tab, text="Import Data", command=self.import_data)
-        import_btn.pack(pady=10)
+        self.import_btn = ttk.Button(tab, text="Import Data", command=self.import_data)
+        self.import_btn.pack(pady=10)
 
         self.has_headers = tk.BooleanVar(value=True)
         headers_check = ttk.Checkbutton(tab, text="First row as headers", variable=self.has_headers)
         headers_check.pack(pady=5)
 
+        self.optimize_dtypes = tk.BooleanVar(value=False)
+        optimize_check = ttk.Checkbutton(tab, text="Optimise memory (compact column types)",
+                                         variable=self.optimize_dtypes)
+        optimize_check.pack(pady=5)
+
+        self.import_progress = ttk.Progressbar(tab, mode="determinate", maximum=100, length=300)
+        self.import_progress.pack(pady=5)
+        self.cancel_import_btn = ttk.Button(tab, text="Cancel Import", command=self.cancel_import,
+                                            state="disabled")
+        self.cancel_import_btn.pack(pady=5)
+
     def import_data(self):
-        """Handle data import from a file and display it."""
-        from .data_import import import_data, assign_column_names
-        file_path = filedialog.askopenfilename(filetypes=[("CSV", "*.csv"), ("Excel", "*.xlsx"), ("Text", "*.txt")])
-        if file_path:
+        """Start loading a file on a worker thread so the window stays responsive."""
+        if self.import_thread is not None and self.import_thread.is_alive():
+            self.message_label.config(text="An import is already running")
+            return
+        file_paths = filedialog.askopenfilenames(filetypes=[("CSV", "*.csv"), ("Excel", "*.xlsx"), ("Text", "*.txt")])
+        if file_paths:
+            # Several selected files are imported in parallel and concatenated
+            file_path = file_paths[0] if len(file_paths) == 1 else list(file_paths)
+            sheet_name = 0
+            if isinstance(file_path, str) and file_path.endswith('.xlsx'):
+                from .data_import import list_sheets, choose_sheet
+                try:
+                    sheets = list_sheets(file_path)
+                    if len(sheets) > 1:
+                        sheet_name = choose_sheet(sheets, parent=self.master)
+                except Exception as e:
+                    self.message_label.config(text=f"Error importing data: {e}")
+                    return
+            self.import_sheet = sheet_name
+            self.import_cancel.clear()
+            self.import_fraction = 0.0
+            self.import_progress["value"] = 0
+            self.import_btn.config(state="disabled")
+            self.cancel_import_btn.config(state="normal")
+            self.message_label.config(text=f"Importing {len(file_paths)} file(s)")
+            self.import_thread = threading.Thread(target=self._load_file,
+                                                  args=(file_path, self.optimize_dtypes.get(), sheet_name),
+                                                  daemon=True)
+            self.import_thread.start()
+            self.master.after(100, self._poll_import)
+
+    def _load_file(self, file_path, optimize_dtypes=False, sheet_name=0):
+        """Parse the file on the worker thread and queue the result for the Tk loop."""
+        from .data_import import import_data, ImportCancelled
+
+        def progress(bytes_read, total_bytes):
+            if self.import_cancel.is_set():
+                raise ImportCancelled()
+            if total_bytes:
+                self.import_fraction = min(bytes_read / total_bytes, 1.0)
+
+        try:
+            data = import_data(file_path, progress=progress, optimize_dtypes=optimize_dtypes, sheet_name=sheet_name)
+            self.import_queue.put(("done", data))
+        except ImportCancelled:
+            self.import_queue.put(("cancelled", None))
+        except Exception as e:
+            self.import_queue.put(("error", e))
+
+    def _poll_import(self):
+        """Update the progress bar and pick up the worker's result once it is ready."""
+        from .data_import import assign_column_names
+        self.import_progress["value"] = self.import_fraction * 100
+        try:
+            status, result = self.import_queue.get_nowait()
+        except queue.Empty:
+            self.master.after(100, self._poll_import)
+            return
+
+        self.import_btn.config(state="normal")
+        self.cancel_import_btn.config(state="disabled")
+        if status == "cancelled":
+            self.import_progress["value"] = 0
+            self.message_label.config(text="Import cancelled")
+        elif status == "error":
+            self.message_label.config(text=f"Error importing data: {result}")
+        else:
             try:
-                self.data = import_data(file_path)
+                # The column name dialog must run on the Tk thread
+                self.data = assign_column_names(result, has_headers=self.has_headers.get(), parent=self.master)
+                # Record the column naming so the method can be replayed headless
+                self.config['import'] = {'has_headers': self.has_headers.get(), 'sheet_name': self.import_sheet}
                 if not self.has_headers.get():
-                    self.data = assign_column_names(self.data, has_headers=False)
-                else:
-                    self.data = assign_column_names(self.data, has_headers=True)
+                    self.config['import']['column_names'] = [str(col) for col in self.data.columns]
+                self.history.clear()
+                self.record_history("Import")
                 self.display_data()
                 self.update_column_lists()
-                self.message_label.config(text=f"Data imported successfully: {self.data.shape}")
+                message = f"Data imported successfully: {self.data.shape}"
+                report = self.data.attrs.get('memory_report')
+                if report:
+                    before = sum(col['bytes_before'] for col in report.values()) / 1e6
+                    after = sum(col['bytes_after'] for col in report.values()) / 1e6
+                    message += f", memory {before:.1f} MB -> {after:.1f} MB"
+                self.message_label.config(text=message)
             except Exception as e:
                 self.message_label.config(text=f"Error importing data: {e}")
 
+    def cancel_import(self):
+        """Ask the running import to stop at its next read."""
+        if self.import_thread is not None and self.import_thread.is_alive():
+            self.import_cancel.set()
+            self.message_label.config(text="Cancelling import...")
+
     def display_data(self):
-        """Show the first few rows of the data in the table."""
+        """Show the data in the virtual table."""
         if self.data is not None:
-            # Clear existing data
-            for row in self.data_tree.get_children():
-                self.data_tree.delete(row)
-
-            # Set column headers
-            self.data_tree["columns"] = list(self.data.columns)
-            for col in self.data.columns:
-                self.data_tree.heading(col, text=col)
-                self.data_tree.column(col, width=100)
-
-            # Insert first 5 rows
-            for _, row in self.data.head().iterrows():
-                self.data_tree.insert("", "end", values=list(row))
+            self.data_table.set_data(self.data)
 
     # --- Method Storage Tab ---
     def create_method_tab(self):
@@ -113,6 +212,9 @@ class MainGUI:
         load_btn = ttk.Button(tab, text="Load Method", command=self.load_method)
         load_btn.pack(pady=5)
 
+        apply_method_btn = ttk.Button(tab, text="Apply Method", command=self.apply_method)
+        apply_method_btn.pack(pady=5)
+
     def save_method(self):
         """Save the current method configuration to a file."""
         from .method_storage import save_method
@@ -129,25 +231,84 @@ class MainGUI:
             self.config = load_method(file_path)
             self.message_label.config(text=f"Method loaded from: {file_path}")
 
+    def apply_method(self):
+        """Replay the steps of the loaded method on the current data."""
+        from .method_storage import apply_method
+        if self.data is not None:
+            try:
+                self.data = apply_method(self.data, self.config, cache=self.step_cache)
+                self.record_history("Apply method")
+                self.display_data()
+                self.update_column_lists()
+                self.message_label.config(text=f"Method applied: {len(self.config.get('steps', []))} steps")
+            except Exception as e:
+                self.message_label.config(text=f"Error applying method: {e}")
+        else:
+            self.message_label.config(text="No data loaded")
+
     # --- Preprocessing Tab ---
     def create_preprocessing_tab(self):
         """Create the Preprocessing tab for data transformations."""
         tab = ttk.Frame(self.notebook)
         self.notebook.add(tab, text="Preprocessing")
 
-        tk.Label(tab, text="Mathematical Expression (e.g., new_col = log10(col1 * 3 + 1))").pack(pady=5)
-        self.expr_entry = tk.Entry(tab, width=50)
+        tk.Label(tab, text="Mathematical Expressions, one per line (e.g., new_col = log10(col1 * 3 + 1))").pack(pady=5)
+        self.expr_entry = tk.Text(tab, width=60, height=4, undo=True)
         self.expr_entry.pack(pady=5)
         apply_btn = ttk.Button(tab, text="Apply Transformation", command=self.apply_transformation)
         apply_btn.pack(pady=5)
 
+        encode_frame = ttk.Frame(tab)
+        encode_frame.pack(pady=5)
+        tk.Label(encode_frame, text="Encode columns (comma separated, empty for all text columns)").grid(row=0, column=0, columnspan=4)
+        self.encode_cols = tk.Entry(encode_frame, width=40)
+        self.encode_cols.grid(row=1, column=0, padx=5)
+        self.encode_method = tk.StringVar(value='ordinal')
+        ttk.Combobox(encode_frame, textvariable=self.encode_method, state="readonly", width=10,
+                     values=['ordinal', 'onehot', 'hashing', 'target']).grid(row=1, column=1, padx=5)
+        tk.Label(encode_frame, text="Target").grid(row=1, column=2)
+        self.encode_target = tk.StringVar()
+        self.encode_target_menu = ttk.Combobox(encode_frame, textvariable=self.encode_target, values=[], width=15)
+        self.encode_target_menu.grid(row=1, column=3, padx=5)
+        encode_btn = ttk.Button(tab, text="Encode", command=self.encode_columns)
+        encode_btn.pack(pady=5)
+
+        fill_frame = ttk.Frame(tab)
+        fill_frame.pack(pady=5)
+        tk.Label(fill_frame, text="Fill missing values").pack(side="left", padx=5)
+        self.fill_method = tk.StringVar(value='mean')
+        ttk.Combobox(fill_frame, textvariable=self.fill_method, state="readonly", width=10,
+                     values=['mean', 'median', 'mode', 'ffill', 'bfill', 'linear', 'time', 'knn']).pack(side="left", padx=5)
+        tk.Label(fill_frame, text="Time column").pack(side="left", padx=5)
+        self.fill_time = tk.StringVar()
+        self.fill_time_menu = ttk.Combobox(fill_frame, textvariable=self.fill_time, state="readonly", values=[], width=15)
+        self.fill_time_menu.pack(side="left", padx=5)
+        fill_btn = ttk.Button(fill_frame, text="Fill", command=self.fill_missing)
+        fill_btn.pack(side="left", padx=5)
+
+        history_frame = ttk.Frame(tab)
+        history_frame.pack(pady=5)
+        undo_btn = ttk.Button(history_frame, text="Undo", command=self.undo)
+        undo_btn.pack(side="left", padx=5)
+        redo_btn = ttk.Button(history_frame, text="Redo", command=self.redo)
+        redo_btn.pack(side="left", padx=5)
+        self.master.bind("<Control-z>", lambda event: self.history_shortcut(event, self.undo))
+        self.master.bind("<Control-y>", lambda event: self.history_shortcut(event, self.redo))
+
     def apply_transformation(self):
         """Apply a mathematical transformation to the data."""
         from .preprocessing import apply_mathematical_transformation
         if self.data is not None:
-            expr = self.expr_entry.get()
+            expr = self.expr_entry.get("1.0", "end").strip()
             if expr:
-                self.data = apply_mathematical_transformation(self.data, expr)
+                try:
+                    self.data = apply_mathematical_transformation(self.data, expr)
+                except Exception as e:
+                    self.message_label.config(text=f"Error applying transformation: {e}")
+                    messagebox.showerror("Transformation failed", str(e))
+                    return
+                self.config.setdefault('steps', []).append({'type': 'transformation', 'expression': expr})
+                self.record_history(expr)
                 self.display_data()
                 self.update_column_lists()
                 self.message_label.config(text=f"Transformation applied: {expr}")
@@ -156,6 +317,84 @@ class MainGUI:
         else:
             self.message_label.config(text="No data loaded")
 
+    def encode_columns(self):
+        """Fit encoders on the current data, encode it and record the fitted encoders as a method step."""
+        from .encoding import fit_encoders
+        from .preprocessing import encode_categorical
+        if self.data is not None:
+            names = [name.strip() for name in self.encode_cols.get().split(",") if name.strip()]
+            method = self.encode_method.get()
+            try:
+                encoders = fit_encoders(self.data, names or None, method, target=self.encode_target.get() or None)
+                self.data = encode_categorical(self.data, encoders=encoders)
+            except ValueError as e:
+                self.message_label.config(text=f"Error encoding columns: {e}")
+                return
+            # The fitted vocabularies are saved with the method and reused when it is replayed
+            self.config.setdefault('steps', []).append({'type': 'encode', 'encoders': encoders})
+            self.record_history(f"Encode ({method})")
+            self.display_data()
+            self.update_column_lists()
+            self.message_label.config(text=f"Encoded {len(encoders)} columns ({method})")
+        else:
+            self.message_label.config(text="No data loaded")
+
+    def fill_missing(self):
+        """Fill the missing values of the data and record the fill as a method step."""
+        from .imputation import fill_values
+        from .preprocessing import fill_missing_values
+        if self.data is not None:
+            method = self.fill_method.get()
+            step = {'type': 'fill_missing', 'method': method}
+            if method == 'time':
+                if not self.fill_time.get():
+                    self.message_label.config(text="Select the time column for time interpolation")
+                    return
+                step['time_column'] = self.fill_time.get()
+            try:
+                if method in ('mean', 'median', 'mode'):
+                    # Record the fitted statistics so replaying the method fills new data alike
+                    step['values'] = fill_values(self.data, method=method)
+                self.data = fill_missing_values(self.data, **{key: value for key, value in step.items() if key != 'type'})
+            except ValueError as e:
+                self.message_label.config(text=f"Error filling missing values: {e}")
+                return
+            self.config.setdefault('steps', []).append(step)
+            self.record_history(f"Fill missing ({method})")
+            self.display_data()
+            self.message_label.config(text=f"Missing values filled ({method})")
+        else:
+            self.message_label.config(text="No data loaded")
+
+    def record_history(self, label):
+        """Record the current data and method steps as a new undo version."""
+        self.history.push(self.data, label, state=list(self.config.get('steps', [])))
+
+    def restore_snapshot(self, snapshot, action):
+        """Show the data and method steps of an undo/redo snapshot."""
+        if snapshot is None:
+            self.message_label.config(text=f"Nothing to {action.lower()}")
+            return
+        self.data = snapshot.data
+        self.config['steps'] = list(snapshot.state)
+        self.display_data()
+        self.update_column_lists()
+        self.message_label.config(text=f"{action}: now at '{snapshot.label}'")
+
+    def history_shortcut(self, event, action):
+        """Run an undo/redo shortcut unless a text field has focus, where it edits the text instead."""
+        if isinstance(event.widget, (tk.Text, tk.Entry, ttk.Entry)):
+            return
+        action()
+
+    def undo(self):
+        """Go back to the previous version of the data."""
+        self.restore_snapshot(self.history.undo(), "Undo")
+
+    def redo(self):
+        """Re-apply the most recently undone change."""
+        self.restore_snapshot(self.history.redo(), "Redo")
+
     # --- Visualization Tab ---
     def create_visualization_tab(self):
         """Create the Visualization tab for plotting data."""
@@ -166,32 +405,162 @@ class MainGUI:
         self.dist_col = tk.StringVar()
         self.dist_col_menu = ttk.Combobox(tab, textvariable=self.dist_col, values=[])
         self.dist_col_menu.pack(pady=5)
+        self.dist_col_menu.bind("<<ComboboxSelected>>", lambda event: self.plot_distribution())
+        bins_frame = ttk.Frame(tab)
+        bins_frame.pack(pady=5)
+        tk.Label(bins_frame, text="Bins").pack(side="left", padx=5)
+        self.dist_bins = tk.IntVar(value=50)
+        tk.Spinbox(bins_frame, from_=2, to=1000, width=6, textvariable=self.dist_bins,
+                   command=self.plot_distribution).pack(side="left")
         plot_btn = ttk.Button(tab, text="Plot Distribution", command=self.plot_distribution)
         plot_btn.pack(pady=5)
 
+        tk.Label(tab, text="Select columns for relationship plot (x, y)").pack(pady=5)
+        cross_frame = ttk.Frame(tab)
+        cross_frame.pack(pady=5)
+        self.cross_x = tk.StringVar()
+        self.cross_x_menu = ttk.Combobox(cross_frame, textvariable=self.cross_x, values=[])
+        self.cross_x_menu.pack(side="left", padx=5)
+        self.cross_y = tk.StringVar()
+        self.cross_y_menu = ttk.Combobox(cross_frame, textvariable=self.cross_y, values=[])
+        self.cross_y_menu.pack(side="left", padx=5)
+        cross_btn = ttk.Button(tab, text="Plot Relationship", command=self.plot_relationship)
+        cross_btn.pack(pady=5)
+        line_btn = ttk.Button(tab, text="Plot Line", command=self.plot_line)
+        line_btn.pack(pady=5)
+
+        tk.Label(tab, text="Dimensionality reduction (method, colour by)").pack(pady=5)
+        reduce_frame = ttk.Frame(tab)
+        reduce_frame.pack(pady=5)
+        self.reduce_method = tk.StringVar(value='pca')
+        ttk.Combobox(reduce_frame, textvariable=self.reduce_method, state="readonly", width=8,
+                     values=['pca', 'tsne', 'umap']).pack(side="left", padx=5)
+        self.reduce_color = tk.StringVar()
+        self.reduce_color_menu = ttk.Combobox(reduce_frame, textvariable=self.reduce_color, values=[])
+        self.reduce_color_menu.pack(side="left", padx=5)
+        reduce_btn = ttk.Button(tab, text="Reduce and Plot", command=self.reduce_and_plot)
+        reduce_btn.pack(pady=5)
+
     def update_column_lists(self):
         """Update column dropdowns in tabs when data changes."""
         if self.data is not None:
             columns = list(self.data.columns)
             self.dist_col_menu['values'] = columns
+            self.encode_target_menu['values'] = columns
+            self.fill_time_menu['values'] = [''] + columns
+            self.cross_x_menu['values'] = columns
+            self.cross_y_menu['values'] = columns
+            self.reduce_color_menu['values'] = [''] + columns
             if columns:
                 self.dist_col.set(columns[0])
 
     def plot_distribution(self):
         """Generate a distribution plot for the selected column."""
-        from .visualization import plot_single_distribution
+        from .visualization import DistributionPlot
         if self.data is not None:
             col = self.dist_col.get()
             if col:
-                self.ax.clear()
-                self.data[col].plot(kind='hist', ax=self.ax, title=f"Distribution of {col}")
-                self.canvas.draw()
+                # A background render finishing later would replace this plot
+                self.render_worker.cancel()
+                if self.dist_plot is None:
+                    self.dist_plot = DistributionPlot(self.ax)
+                try:
+                    # Reuses the plot's artists and blits when the axes are unchanged
+                    self.dist_plot.show(self.data[col], bins=self.dist_bins.get())
+                except (ValueError, tk.TclError) as e:
+                    self.message_label.config(text=f"Error plotting distribution: {e}")
+                    return
                 self.message_label.config(text=f"Distribution plotted for column: {col}")
             else:
                 self.message_label.config(text="Please select a column")
         else:
             self.message_label.config(text="No data loaded")
 
+    def plot_relationship(self):
+        """Plot one column against another, as a density raster for large data."""
+        from .visualization import plot_cross_relationship
+        if self.data is not None:
+            x, y = self.cross_x.get(), self.cross_y.get()
+            if x and y:
+                data = self.data
+                self.render_plot(lambda ax: plot_cross_relationship(ax, data, x, y),
+                                 f"Relationship plotted: {y} vs {x}")
+            else:
+                self.message_label.config(text="Please select two columns")
+        else:
+            self.message_label.config(text="No data loaded")
+
+    def plot_line(self):
+        """Plot one column against another as a line, e.g. a spectrum or time series."""
+        from .visualization import plot_line
+        if self.data is not None:
+            x, y = self.cross_x.get(), self.cross_y.get()
+            if x and y:
+                data = self.data
+                self.render_plot(lambda ax: plot_line(ax, data, x, y), f"Line plotted: {y} vs {x}")
+            else:
+                self.message_label.config(text="Please select two columns")
+        else:
+            self.message_label.config(text="No data loaded")
+
+    def reduce_and_plot(self):
+        """Plot a 2D projection of the numeric columns; refits only when the data changed."""
+        from .visualization import reduce_and_plot
+        if self.data is not None:
+            data, method, color = self.data, self.reduce_method.get(), self.reduce_color.get() or None
+            self.render_plot(lambda ax: reduce_and_plot(ax, data, method=method, color=color),
+                             f"{method.upper()} projection plotted")
+        else:
+            self.message_label.config(text="No data loaded")
+
+    def render_plot(self, plot, message):
+        """Render a plot on the worker thread; a newer plot request cancels this one."""
+        polling = self.render_worker.busy()
+        self.render_worker.submit(plot, self.fig.get_size_inches(), self.fig.dpi)
+        self.render_message = message
+        self.message_label.config(text="Rendering plot...")
+        if not polling:
+            self.master.after(50, self._poll_render)
+
+    def _poll_render(self):
+        """Show the finished background render, or check again shortly."""
+        result = self.render_worker.poll()
+        if result is None:
+            if self.render_worker.busy():
+                self.master.after(50, self._poll_render)
+            return
+        if result.error is not None:
+            self.message_label.config(text=f"Error plotting: {result.error}")
+        else:
+            self.show_rendered(result)
+            self.message_label.config(text=self.render_message)
+        if self.render_worker.busy():
+            self.master.after(50, self._poll_render)
+
+    def show_rendered(self, result):
+        """Adopt a figure rendered by the worker and blit its RGBA buffer into the Tk canvas."""
+        figure = result.figure
+        figure.set_canvas(self.canvas)
+        self.canvas.figure = figure
+        # Canvas callbacks live on the figure, so the toolbar's zoom and pan handlers
+        # stayed with the old one; a new toolbar connects them to the adopted figure
+        mode, toolbar_master = self.toolbar.mode, self.toolbar.master
+        self.toolbar.destroy()
+        self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_master, pack_toolbar=False)
+        self.toolbar.pack(side="bottom", fill="x", before=self.canvas.get_tk_widget())
+        if mode == 'zoom rect':
+            self.toolbar.zoom()
+        elif mode == 'pan/zoom':
+            self.toolbar.pan()
+        # The worker's renderer has the same size as the canvas, so its pixels are shown
+        # as they are and later redraws (zoom, pan) reuse it
+        self.canvas.renderer = result.canvas.get_renderer()
+        self.canvas.blit()
+        self.fig, self.ax = figure, result.ax
+        # Plot helpers such as LODLine must stay alive to keep responding to zoom and pan
+        self.rendered_plot = result.value
+        self.dist_plot = None
+
     # --- Modeling Tab ---
     def create_modeling_tab(self):
         """Create the Modeling tab for training machine learning models."""
@@ -0,0 +1,179 @@
+import numpy as np
+import pandas as pd
+from .column_cache import ColumnCache
+
+# Number of fine bins kept per column; plotted histograms are re-binned from these
+FINE_BINS = 4096
+
+# Bin specifications whose counts are remembered per histogram
+REBIN_CACHE_SIZE = 64
+
+# Rows binned at a time, bounding the size of temporary arrays
+BLOCK_ROWS = 1_000_000
+
+class Histogram:
+    """
+    Fine-grained bin counts of a numeric column, built in one pass or incrementally.
+
+    The counts cover FINE_BINS equal bins starting at lo. When a later chunk falls
+    outside that range the range is doubled, merging neighbouring bins pairwise, so
+    counts stay exact and only the resolution drops. Histograms with fewer bins, or
+    over a sub-range, are derived from the fine counts without touching the data.
+    """
+
+    def __init__(self, fine_bins=FINE_BINS):
+        self.fine_bins = fine_bins
+        self.counts = np.zeros(fine_bins, dtype=np.int64)
+        self.lo = None
+        self.width = None
+        self.min = np.inf
+        self.max = -np.inf
+        self.missing = 0
+        self._rebinned = {}
+
+    @classmethod
+    def from_values(cls, values, fine_bins=FINE_BINS):
+        """Histogram of an array or Series of numbers."""
+        histogram = cls(fine_bins)
+        values = np.asarray(values, dtype=float)
+        blocks = [values[start:start + BLOCK_ROWS] for start in range(0, len(values), BLOCK_ROWS)]
+        # Setting the range from the whole column up front avoids merging bins later
+        lo = min((np.min(block[np.isfinite(block)], initial=np.inf) for block in blocks), default=np.inf)
+        hi = max((np.max(block[np.isfinite(block)], initial=-np.inf) for block in blocks), default=-np.inf)
+        if lo <= hi:
+            histogram._set_range(lo, hi)
+        for block in blocks:
+            histogram.update(block)
+        return histogram
+
+    def _set_range(self, lo, hi):
+        self.lo = float(lo)
+        # A constant column still gets a bin of non-zero width
+        self.width = (float(hi) - self.lo) / self.fine_bins or 1.0 / self.fine_bins
+        # Nudge so the maximum falls inside the last bin
+        self.width *= 1 + 1e-9
+
+    def _grow(self, lo, hi):
+        """Double the range until it covers [lo, hi], merging bins pairwise."""
+        half = self.fine_bins // 2
+        while lo < self.lo or hi >= self.lo + self.width * self.fine_bins:
+            merged = self.counts.reshape(half, 2).sum(axis=1)
+            if lo < self.lo:
+                # Extend downwards: the old range becomes the upper half
+                self.counts = np.concatenate([np.zeros(half, dtype=np.int64), merged])
+                self.lo -= self.width * self.fine_bins
+            else:
+                self.counts = np.concatenate([merged, np.zeros(half, dtype=np.int64)])
+            self.width *= 2
+
+    def update(self, values):
+        """
+        Add a chunk of values to the counts.
+
+        Args:
+            values (array-like): Numbers; NaN and infinite values are counted as missing.
+        """
+        values = np.asarray(values, dtype=float)
+        finite = values[np.isfinite(values)]
+        self.missing += len(values) - len(finite)
+        if not len(finite):
+            return self
+        lo, hi = finite.min(), finite.max()
+        if self.lo is None:
+            self._set_range(lo, hi)
+        else:
+            self._grow(lo, hi)
+        self.min, self.max = min(self.min, lo), max(self.max, hi)
+        bins = ((finite - self.lo) / self.width).astype(np.int64)
+        np.minimum(bins, self.fine_bins - 1, out=bins)
+        self.counts += np.bincount(bins, minlength=self.fine_bins)
+        self._rebinned.clear()
+        return self
+
+    def rebin(self, bins=50, range=None):
+        """
+        Counts over equal bins, derived from the fine counts.
+
+        Each fine bin is assigned to the coarse bin containing its centre, so bin edges
+        are accurate to one fine bin width.
+
+        Args:
+            bins (int): Number of bins.
+            range (tuple, optional): (lower, upper) of the bins, defaults to the data range.
+
+        Returns:
+            tuple: (counts, edges) as numpy arrays, with len(edges) == bins + 1.
+        """
+        lower, upper = (self.min, self.max) if range is None else range
+        key = (bins, lower, upper)
+        # Read once: the Tk loop and the render worker may rebin the same cached histogram
+        result = self._rebinned.get(key)
+        if result is None:
+            if self.lo is None:
+                lower, upper = (0.0, 1.0) if range is None else range
+                result = np.zeros(bins, dtype=np.int64), np.linspace(lower, upper, bins + 1)
+            else:
+                if upper <= lower:
+                    upper = lower + self.width
+                centres = self.lo + (np.arange(self.fine_bins) + 0.5) * self.width
+                coarse = np.floor((centres - lower) / (upper - lower) * bins).astype(np.int64)
+                # Fine bins straddling an edge, such as the ones holding the minimum and
+                # maximum, still belong to the first or last bin
+                coarse[(coarse < 0) & (centres + self.width / 2 > lower)] = 0
+                coarse[(coarse >= bins) & (centres - self.width / 2 <= upper)] = bins - 1
+                inside = (coarse >= 0) & (coarse < bins)
+                counts = np.bincount(coarse[inside], weights=self.counts[inside], minlength=bins).astype(np.int64)
+                result = counts, np.linspace(lower, upper, bins + 1)
+            if len(self._rebinned) >= REBIN_CACHE_SIZE:
+                self._rebinned.clear()
+            self._rebinned[key] = result
+        return result
+
+def numeric_values(series):
+    """Values of a numeric column as floats, missing values as NaN."""
+    if not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)):
+        raise ValueError(f"Column {series.name} is not numeric.")
+    return series.to_numpy(dtype=float, na_value=np.nan)
+
+# Fine histograms of recently plotted columns
+_HISTOGRAM_CACHE = ColumnCache(maxsize=256)
+
+def column_histogram(series):
+    """
+    Fine histogram of a column, computed on first use and cached per column buffer.
+
+    Args:
+        series (pd.Series): A numeric column.
+
+    Returns:
+        Histogram: The column's histogram.
+
+    Raises:
+        ValueError: If the column is not numeric.
+    """
+    histogram = _HISTOGRAM_CACHE.get(series)
+    if histogram is None:
+        histogram = Histogram.from_values(numeric_values(series))
+        _HISTOGRAM_CACHE.put(series, histogram)
+    return histogram
+
+def chunk_histograms(chunks, columns=None):
+    """
+    Histograms of several columns built incrementally over chunks, e.g. from data_import.iter_data.
+
+    Args:
+        chunks (iterable of pd.DataFrame): Consecutive pieces of the data.
+        columns (list, optional): Columns to count, defaults to the numeric columns of the first chunk.
+
+    Returns:
+        dict: Mapping of column name to Histogram.
+    """
+    histograms = None
+    for chunk in chunks:
+        if histograms is None:
+            if columns is None:
+                columns = [col for col in chunk.columns if pd.api.types.is_numeric_dtype(chunk[col])]
+            histograms = {col: Histogram() for col in columns}
+        for col in columns:
+            histograms[col].update(numeric_values(chunk[col]))
+    return histograms or {}
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+# Default memory cap of the undo history
+DEFAULT_HISTORY_BYTES = 2 * 1024 ** 3
+
+class Snapshot:
+    """A recorded version of the data with a label and any extra state to restore with it."""
+
+    def __init__(self, data, label, state=None):
+        self.data = data
+        self.label = label
+        self.state = state
+
+def _buffer_key(series):
+    """Key identifying the memory behind a column, equal for columns sharing their data."""
+    if isinstance(series.dtype, np.dtype):
+        # A view of the column's buffer, so its address identifies the buffer
+        values = series.to_numpy()
+        return ('numpy', values.__array_interface__['data'][0], values.nbytes, values.strides)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        return ('categorical', codes.__array_interface__['data'][0], codes.nbytes)
+    if getattr(series.dtype, 'storage', None) == 'pyarrow' or isinstance(series.dtype, pd.ArrowDtype):
+        chunks = series.array.__arrow_array__().chunks
+        return ('arrow',) + tuple(buffer.address for chunk in chunks for buffer in chunk.buffers() if buffer)
+    # Other extension arrays are only recognised as shared when they are the same object
+    return ('object', id(series.array))
+
+def _column_buffers(df):
+    """
+    Identify the memory behind each column with its size in bytes.
+
+    Columns of frames derived without copying (see preprocessing._target_frame) keep
+    pointing at the same buffers, so they map to the same keys and are counted once.
+    """
+    buffers = {}
+    for i in range(df.shape[1]):
+        series = df.iloc[:, i]
+        buffers[_buffer_key(series)] = series.memory_usage(index=False, deep=True)
+    return buffers
+
+class DataHistory:
+    """
+    Undo/redo stack of DataFrame versions that share unchanged column buffers.
+
+    Versions are stored as the DataFrames themselves. Because preprocessing steps
+    return frames that reuse the columns they do not change, each snapshot only adds
+    the memory of its new columns. When the buffers held only by past or undone
+    versions exceed the memory cap, the oldest undo snapshots are dropped.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_HISTORY_BYTES):
+        """
+        Args:
+            max_bytes (int): Maximum memory the history may hold on top of the current
+                version, counting shared buffers once.
+        """
+        self.max_bytes = max_bytes
+        self.undo_stack = []  # Older snapshots, oldest first
+        self.redo_stack = []  # Undone snapshots, most recently undone last
+        self.current = None
+
+    def clear(self):
+        """Forget every snapshot."""
+        self.undo_stack = []
+        self.redo_stack = []
+        self.current = None
+
+    def push(self, data, label, state=None):
+        """
+        Record a new current version, discarding anything that could be redone.
+
+        Args:
+            data (pd.DataFrame): The new version of the data.
+            label (str): Description of the change, e.g. the applied expression.
+            state (optional): Extra state restored with this version.
+        """
+        if self.current is not None:
+            self.undo_stack.append(self.current)
+        self.current = Snapshot(data, label, state)
+        self.redo_stack = []
+        self._evict()
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def undo(self):
+        """
+        Step back to the previous version.
+
+        Returns:
+            Snapshot or None: The restored snapshot, or None if there is nothing to undo.
+        """
+        if not self.undo_stack:
+            return None
+        self.redo_stack.append(self.current)
+        self.current = self.undo_stack.pop()
+        return self.current
+
+    def redo(self):
+        """
+        Step forward to the most recently undone version.
+
+        Returns:
+            Snapshot or None: The restored snapshot, or None if there is nothing to redo.
+        """
+        if not self.redo_stack:
+            return None
+        self.undo_stack.append(self.current)
+        self.current = self.redo_stack.pop()
+        return self.current
+
+    def memory_usage(self):
+        """
+        Memory held by past and undone versions that the current version does not share.
+
+        Returns:
+            int: Size in bytes.
+        """
+        current = {} if self.current is None else _column_buffers(self.current.data)
+        buffers = {}
+        for snapshot in self.undo_stack + self.redo_stack:
+            buffers.update(_column_buffers(snapshot.data))
+        return sum(size for key, size in buffers.items() if key not in current)
+
+    def _evict(self):
+        """Drop the oldest undo snapshots until the history fits in the memory cap."""
+        while self.undo_stack and self.memory_usage() > self.max_bytes:
+            self.undo_stack.pop(0)
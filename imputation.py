@@ -0,0 +1,355 @@
+import numpy as np
+import pandas as pd
+
+# Values kept per level of the streaming quantile sketch
+SKETCH_CAPACITY = 4096
+
+# Distinct values tracked by the streaming mode counter
+MODE_CAPACITY = 1024
+
+# Neighbours averaged by KNN imputation
+DEFAULT_NEIGHBORS = 5
+
+# Rows with an observed value that KNN imputation indexes at most, sampled at random
+MAX_DONORS = 1_000_000
+
+class QuantileSketch:
+    """
+    Streaming approximate quantiles in bounded memory.
+
+    Values are kept in levels where each value stands for 2**level input values. When
+    a level holds more than its capacity it is sorted and every other value is promoted
+    to the next level, so the sketch grows with the logarithm of the input size. The
+    rank error is around a percent for the default capacity.
+    """
+
+    def __init__(self, capacity=SKETCH_CAPACITY, seed=0):
+        self.capacity = capacity
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """Add a batch of values, ignoring missing ones."""
+        values = np.asarray(values, dtype=float)
+        self.levels[0] = np.concatenate([self.levels[0], values[~np.isnan(values)]])
+        level = 0
+        while level < len(self.levels) and len(self.levels[level]) > self.capacity:
+            items = np.sort(self.levels[level])
+            if len(items) % 2:
+                # The odd value out stays on this level
+                self.levels[level], items = items[-1:], items[:-1]
+            else:
+                self.levels[level] = np.empty(0)
+            promoted = items[self.rng.integers(2)::2]
+            if level + 1 == len(self.levels):
+                self.levels.append(promoted)
+            else:
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+        return self
+
+    def quantile(self, q):
+        """
+        Approximate q-quantile of the values seen so far.
+
+        Returns:
+            float: The quantile, NaN if no values were seen.
+        """
+        values = np.concatenate(self.levels)
+        if not len(values):
+            return np.nan
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values)
+        cumulative = np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1])
+        return float(values[order][min(position, len(values) - 1)])
+
+class FrequentItems:
+    """
+    Streaming approximate most frequent value (Misra-Gries summary).
+
+    At most capacity candidate counts are kept. When a batch adds more, every count
+    is lowered by the count just below the cut and non-positive ones are dropped, so
+    any value occurring in more than 1/capacity of the rows is never lost.
+    """
+
+    def __init__(self, capacity=MODE_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=float)
+
+    def update(self, values):
+        """Add a batch of values, ignoring missing ones."""
+        counts = pd.Series(values).value_counts()
+        self.counts = self.counts.add(counts, fill_value=0) if len(self.counts) else counts.astype(float)
+        if len(self.counts) > self.capacity:
+            counts = self.counts.sort_values(ascending=False)
+            counts -= counts.iloc[self.capacity]
+            self.counts = counts[counts > 0]
+        return self
+
+    def mode(self):
+        """Most frequent value seen so far, None if no value stood out from the rest."""
+        return self.counts.idxmax() if len(self.counts) else None
+
+def _numeric_columns(df, columns=None):
+    return [col for col in (df.columns if columns is None else columns) if pd.api.types.is_numeric_dtype(df[col])]
+
+def _plain(value):
+    """A fill value as a plain Python value that can be stored in a method; timestamps become ISO 8601 text."""
+    if isinstance(value, (pd.Timestamp, pd.Timedelta)):
+        return value.isoformat()
+    return value.item() if isinstance(value, np.generic) else value
+
+def _fill(series, value):
+    """Fill the gaps of a column with one value, keeping the column's dtype."""
+    if isinstance(value, str) and pd.api.types.is_datetime64_any_dtype(series.dtype):
+        value = pd.Timestamp(value)
+    elif isinstance(value, str) and pd.api.types.is_timedelta64_dtype(series.dtype):
+        value = pd.Timedelta(value)
+    elif isinstance(value, float) and pd.api.types.is_bool_dtype(series.dtype):
+        value = bool(round(value))
+    elif isinstance(value, float) and pd.api.types.is_integer_dtype(series.dtype):
+        # A mean or median of integers, e.g. in a nullable Int64 column
+        value = round(value)
+    return series.fillna(value)
+
+def _restore_dtype(series, values):
+    """Interpolated float values as a column with the dtype of the original, rounding integers."""
+    if pd.api.types.is_integer_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+        values = np.round(values)
+    return pd.Series(values, index=series.index, name=series.name).astype(series.dtype)
+
+def fill_statistics(chunks, columns=None, method='median'):
+    """
+    Compute fill values in one pass over chunks of data, e.g. from data_import.iter_data.
+
+    Means are exact; medians and modes are approximated with QuantileSketch and
+    FrequentItems so memory does not grow with the number of rows.
+
+    Args:
+        chunks (iterable of pd.DataFrame): Consecutive pieces of the data.
+        columns (list, optional): Columns to summarise, defaults to all columns of the
+            first chunk (numeric ones for mean and median).
+        method (str): 'mean', 'median' or 'mode'.
+
+    Returns:
+        dict: Mapping of column name to fill value, for the values argument of impute.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    if method not in ('mean', 'median', 'mode'):
+        raise ValueError(f"Unknown streaming fill method: {method}")
+    summaries = None
+    for chunk in chunks:
+        if summaries is None:
+            if columns is None:
+                columns = list(chunk.columns) if method == 'mode' else _numeric_columns(chunk)
+            summaries = {col: [0.0, 0] if method == 'mean' else
+                         QuantileSketch() if method == 'median' else FrequentItems()
+                         for col in columns}
+        for col in columns:
+            if method == 'mean':
+                values = chunk[col].to_numpy(dtype=float, na_value=np.nan)
+                summaries[col][0] += np.nansum(values)
+                summaries[col][1] += int(np.count_nonzero(~np.isnan(values)))
+            else:
+                summaries[col].update(chunk[col].to_numpy() if method == 'mode' else
+                                      chunk[col].to_numpy(dtype=float, na_value=np.nan))
+    values = {}
+    for col, summary in (summaries or {}).items():
+        if method == 'mean':
+            value = summary[0] / summary[1] if summary[1] else None
+        elif method == 'median':
+            value = summary.quantile(0.5)
+            value = None if np.isnan(value) else value
+        else:
+            value = summary.mode()
+        values[col] = _plain(value)
+    return values
+
+def fill_values(df, columns=None, method='median'):
+    """
+    Compute exact fill values of data held in memory, the counterpart of fill_statistics.
+
+    Only columns with missing values are summarised. Timestamps are returned as
+    ISO 8601 text, which impute converts back when filling.
+
+    Args:
+        df (pd.DataFrame): The data.
+        columns (list, optional): Columns to summarise, defaults to all columns
+            (numeric ones for mean and median).
+        method (str): 'mean', 'median' or 'mode'.
+
+    Returns:
+        dict: Mapping of column name to fill value, for the values argument of impute.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    if method not in ('mean', 'median', 'mode'):
+        raise ValueError(f"Unknown fill statistic: {method}")
+    if columns is None:
+        columns = list(df.columns) if method == 'mode' else _numeric_columns(df)
+    values = {}
+    for col in [col for col in columns if df[col].hasnans]:
+        series = df[col]
+        if method == 'mode':
+            modes = series.mode()
+            value = modes.iloc[0] if len(modes) else None
+        else:
+            value = series.mean() if method == 'mean' else series.median()
+            value = None if pd.isna(value) else value
+        values[col] = _plain(value)
+    return values
+
+def interpolate(series, x=None):
+    """
+    Linearly interpolate the missing values of a numeric column.
+
+    Values before the first and after the last observed value stay missing, as with
+    pandas' default interpolation.
+
+    Args:
+        series (pd.Series): Values with gaps.
+        x (array-like, optional): Position of each row, e.g. timestamps. Defaults to
+            equally spaced rows.
+
+    Returns:
+        np.ndarray: The interpolated values.
+    """
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    x = np.arange(len(values), dtype=float) if x is None else np.asarray(x, dtype=float)
+    missing = np.isnan(values)
+    observed = ~missing & ~np.isnan(x)
+    if not observed.any():
+        return values
+    order = np.argsort(x[observed], kind='stable')
+    known_x, known_y = x[observed][order], values[observed][order]
+    inside = missing & (x >= known_x[0]) & (x <= known_x[-1])
+    filled = values.copy()
+    filled[inside] = np.interp(x[inside], known_x, known_y)
+    return filled
+
+def _time_positions(df, time_column):
+    """Timestamps of the rows as numbers, from a column or the DatetimeIndex."""
+    if time_column is not None:
+        times = pd.to_datetime(df[time_column])
+    elif isinstance(df.index, pd.DatetimeIndex):
+        times = df.index.to_series()
+    else:
+        raise ValueError("Time interpolation requires a time column or a DatetimeIndex.")
+    positions = times.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(float)
+    positions[times.isna().to_numpy()] = np.nan
+    return positions
+
+def knn_impute(df, columns, features=None, n_neighbors=DEFAULT_NEIGHBORS, max_donors=MAX_DONORS, seed=0):
+    """
+    Fill each missing value with the mean of its nearest rows where the value is observed.
+
+    Distances are measured over standardised feature columns without missing values,
+    and neighbours are found with a k-d tree instead of comparing every pair of rows.
+
+    Args:
+        df (pd.DataFrame): The data.
+        columns (list): Numeric columns to fill.
+        features (list, optional): Columns measuring the distance between rows,
+            defaults to the numeric columns without missing values.
+        n_neighbors (int): Number of neighbours averaged.
+        max_donors (int): Largest number of rows indexed per column, sampled at random.
+        seed (int): Seed of the donor sample.
+
+    Returns:
+        dict: Mapping of column name to filled values.
+
+    Raises:
+        ValueError: If scipy is not installed or there are no usable feature columns.
+    """
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        raise ValueError("KNN imputation requires scipy.")
+    if features is None:
+        features = [col for col in _numeric_columns(df) if col not in columns and not df[col].hasnans]
+    if not features:
+        raise ValueError("KNN imputation needs numeric feature columns without missing values.")
+    points = df[features].to_numpy(dtype=float)
+    scale = points.std(axis=0)
+    points = (points - points.mean(axis=0)) / np.where(scale > 0, scale, 1)
+    rng = np.random.default_rng(seed)
+    filled = {}
+    for col in columns:
+        values = df[col].to_numpy(dtype=float, na_value=np.nan)
+        missing = np.isnan(values)
+        donors = np.flatnonzero(~missing)
+        if not missing.any() or not len(donors):
+            continue
+        if len(donors) > max_donors:
+            donors = np.sort(rng.choice(donors, max_donors, replace=False))
+        k = min(n_neighbors, len(donors))
+        _, neighbours = cKDTree(points[donors]).query(points[missing], k=k, workers=-1)
+        neighbours = neighbours.reshape(int(missing.sum()), k)
+        values = values.copy()
+        values[missing] = values[donors][neighbours].mean(axis=1)
+        filled[col] = values
+    return filled
+
+# Methods accepted by impute
+IMPUTATION_METHODS = ('mean', 'median', 'mode', 'ffill', 'bfill', 'linear', 'time', 'knn', 'value')
+
+def impute(df, columns=None, method='mean', value=None, values=None, time_column=None,
+           features=None, n_neighbors=DEFAULT_NEIGHBORS):
+    """
+    Compute filled versions of the columns of a DataFrame that have missing values.
+
+    Args:
+        df (pd.DataFrame): The data.
+        columns (list, optional): Columns to fill, defaults to all columns.
+        method (str): One of IMPUTATION_METHODS. 'linear' interpolates between
+            neighbouring rows, 'time' between timestamps of time_column or the index.
+        value (optional): Fill value for method 'value'.
+        values (dict, optional): Precomputed fill value per column, e.g. from
+            fill_statistics; used instead of computing the statistic from df.
+        time_column (str, optional): Column of timestamps for method 'time'.
+        features (list, optional): Distance columns for method 'knn'.
+        n_neighbors (int): Number of neighbours for method 'knn'.
+
+    Returns:
+        dict: Mapping of column name to filled values, only for columns that changed.
+            The filled columns keep their dtype; interpolated integers are rounded.
+
+    Raises:
+        ValueError: If the method is unknown or cannot be applied.
+    """
+    if method not in IMPUTATION_METHODS:
+        raise ValueError(f"Unknown fill method: {method}")
+    columns = [col for col in (df.columns if columns is None else columns) if df[col].hasnans]
+    if values is not None:
+        return {col: _fill(df[col], values[col]) for col in columns if values.get(col) is not None}
+    if method in ('linear', 'time', 'knn', 'mean', 'median'):
+        # Statistics and interpolation only apply to numeric columns
+        columns = _numeric_columns(df, columns)
+    if method == 'knn':
+        filled = knn_impute(df, columns, features, n_neighbors)
+        return {col: _restore_dtype(df[col], values) for col, values in filled.items()}
+    if method in ('linear', 'time'):
+        x = _time_positions(df, time_column) if method == 'time' else None
+        return {col: _restore_dtype(df[col], interpolate(df[col], x)) for col in columns}
+    filled = {}
+    for col in columns:
+        series = df[col]
+        if method == 'ffill':
+            filled[col] = series.ffill()
+        elif method == 'bfill':
+            filled[col] = series.bfill()
+        elif method == 'value':
+            filled[col] = series.fillna(value)
+        elif method == 'mode':
+            modes = series.mode()
+            if len(modes):
+                filled[col] = series.fillna(modes.iloc[0])
+        else:
+            statistic = series.mean() if method == 'mean' else series.median()
+            if not pd.isna(statistic):
+                filled[col] = _fill(series, _plain(statistic))
+    return filled
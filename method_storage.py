@@ -0,0 +1,169 @@
+import json
+import os
+import tempfile
+
+def save_method(config, file_path):
+    """
+    Save a method configuration to a JSON file.
+    
+    The JSON is written to a temporary file next to the destination, which then
+    replaces it, so a failure part way never leaves a truncated method file.
+    
+    Args:
+        config (dict): The method configuration, as built up in MainGUI.config.
+        file_path (str): Path of the JSON file to write.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.method-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2)
+        # mkstemp creates the file private; give it the permissions open() would
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def load_method(file_path):
+    """
+    Load a method configuration from a JSON file.
+    
+    Args:
+        file_path (str): Path of the JSON file to read.
+    
+    Returns:
+        dict: The method configuration.
+    
+    Raises:
+        ValueError: If the file does not contain a method configuration.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError("Method file must contain a JSON object.")
+    return config
+
+def _step_options(step):
+    """Keyword arguments of a step, without its type."""
+    return {key: value for key, value in step.items() if key != 'type'}
+
+def _apply_transformation(df, step, inplace=False):
+    """Apply a 'transformation' step."""
+    from .preprocessing import apply_mathematical_transformation
+    return apply_mathematical_transformation(df, step['expression'], inplace=inplace)
+
+def _apply_truncation(df, step, inplace=False):
+    """Apply a 'truncate' step."""
+    from .preprocessing import truncate_data
+    return truncate_data(df, inplace=inplace, **_step_options(step))
+
+def _apply_fill(df, step, inplace=False):
+    """Apply a 'fill_missing' step."""
+    from .preprocessing import fill_missing_values
+    return fill_missing_values(df, inplace=inplace, **_step_options(step))
+
+def _apply_encoding(df, step, inplace=False):
+    """Apply an 'encode' step."""
+    from .preprocessing import encode_categorical
+    return encode_categorical(df, inplace=inplace, **_step_options(step))
+
+# Functions applying each step type of a method
+STEP_FUNCTIONS = {
+    'transformation': _apply_transformation,
+    'truncate': _apply_truncation,
+    'fill_missing': _apply_fill,
+    'encode': _apply_encoding,
+}
+
+def apply_import_settings(df, config):
+    """
+    Apply the column naming recorded at import time to freshly imported data.
+    
+    Args:
+        df (pd.DataFrame): The imported data.
+        config (dict): The method configuration.
+    
+    Returns:
+        pd.DataFrame: The data with the recorded column names.
+    
+    Raises:
+        ValueError: If the recorded column names do not match the data.
+    """
+    column_names = config.get('import', {}).get('column_names')
+    if column_names is not None:
+        if len(column_names) != len(df.columns):
+            raise ValueError("Number of column names does not match number of columns.")
+        df.columns = column_names
+    return df
+
+def apply_method(df, config, inplace=False, cache=None, data_key=None):
+    """
+    Replay the steps of a method configuration on a DataFrame.
+    
+    Only the first step may copy: it returns a frame sharing unchanged columns with df,
+    and every later step modifies that frame in place.
+    
+    With a cache, every step result is memoised under a hash of the input data and the
+    steps up to it (see step_cache.step_keys). Replaying resumes from the last step
+    whose result is cached, so after editing a step only that step and the ones after
+    it are recomputed. Steps then never modify their input, since it may be cached.
+    
+    Args:
+        df (pd.DataFrame): The data to process.
+        config (dict): The method configuration with a list of 'steps'.
+        inplace (bool): Whether the first step may also modify df itself.
+        cache (StepCache, optional): Cache of step results.
+        data_key (str, optional): Hash identifying df, e.g. the import cache key of its
+            file; computed from the contents of df when omitted.
+    
+    Returns:
+        pd.DataFrame: The processed data.
+    
+    Raises:
+        ValueError: If a step has an unknown type.
+    """
+    steps = config.get('steps', [])
+    for step in steps:
+        if step.get('type') not in STEP_FUNCTIONS:
+            raise ValueError(f"Unknown method step type: {step.get('type')}")
+
+    keys = [None] * len(steps)
+    start = 0
+    if cache is not None and steps:
+        from .step_cache import hash_frame, step_keys
+        keys = step_keys(data_key or hash_frame(df), steps)
+        inplace = False
+        for i in range(len(steps) - 1, -1, -1):
+            cached = cache.get(keys[i])
+            if cached is not None:
+                df, start = cached, i + 1
+                break
+
+    for step, key in zip(steps[start:], keys[start:]):
+        df = STEP_FUNCTIONS[step['type']](df, step, inplace=inplace)
+        if cache is not None:
+            cache.put(key, df)
+        else:
+            inplace = True
+    return df
+
+def iter_method(chunks, config):
+    """
+    Apply a method to a stream of chunks, e.g. from data_import.iter_data.
+    
+    Steps holding fitted state, such as encode steps with their vocabularies, give
+    every chunk the same encoding as the data the method was built on.
+    
+    Args:
+        chunks (iterable of pd.DataFrame): Consecutive pieces of the data.
+        config (dict): The method configuration with a list of 'steps'.
+    
+    Yields:
+        pd.DataFrame: Each processed chunk.
+    """
+    for chunk in chunks:
+        # Chunks are not shared with the caller, so steps may modify them in place
+        yield apply_method(chunk, config, inplace=True)
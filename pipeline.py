@@ -0,0 +1,147 @@
+import argparse
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+def process_file(config, file_path, output_dir, output_format='csv', step_cache=True, name=None):
+    """
+    Run the import, preprocessing and export steps of a method on one file.
+
+    Args:
+        config (dict): The method configuration.
+        file_path (str): Path of the input data file.
+        output_dir (str): Directory where the processed data is written.
+        output_format (str): Extension of the output file, 'csv' or 'xlsx'.
+        step_cache (bool): Whether to memoise step results on disk, so re-running an
+            edited method only recomputes the edited step and the steps after it.
+        name (str, optional): Output path relative to output_dir, without extension,
+            defaults to the input's file name (see output_names).
+
+    Returns:
+        str: Path of the written output file.
+    """
+    from .data_import import import_data
+    from .exporting import export_data
+    from .method_storage import apply_import_settings, apply_method
+    sheet_name = config.get('import', {}).get('sheet_name', 0)
+    df = import_data(file_path, sheet_name=sheet_name)
+    df = apply_import_settings(df, config)
+    if step_cache:
+        from .data_cache import cache_key
+        from .step_cache import StepCache
+        # The file fingerprint and import settings identify the data without hashing it
+        data_key = cache_key(file_path, sheet_name=sheet_name, settings=config.get('import'))
+        df = apply_method(df, config, cache=StepCache(), data_key=data_key)
+    else:
+        # The freshly imported frame is ours, so every step can work in place
+        df = apply_method(df, config, inplace=True)
+    if name is None:
+        name = os.path.splitext(os.path.basename(file_path))[0]
+    output_path = os.path.join(output_dir, f"{name}.{output_format}")
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    export_data(df, output_path)
+    return output_path
+
+def _process_file_safely(config, file_path, output_dir, output_format, step_cache, name):
+    """Run process_file in a worker and report failures instead of raising them."""
+    try:
+        return file_path, process_file(config, file_path, output_dir, output_format, step_cache, name), None
+    except Exception as e:
+        return file_path, None, f"{type(e).__name__}: {e}"
+
+def expand_inputs(patterns):
+    """
+    Expand glob patterns into a sorted, de-duplicated list of input files.
+
+    Args:
+        patterns (list of str): File paths or glob patterns.
+
+    Returns:
+        list of str: The matching file paths.
+    """
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        files.extend(match for match in matches if match not in files)
+    return files
+
+def output_names(file_paths):
+    """
+    Distinct output names for input files, so parallel workers never write the same file.
+
+    Each name is the input's path relative to the directory shared by all inputs,
+    without extension, e.g. m1/f0 and m2/f0 for d/m1/f0.csv and d/m2/f0.csv. Inputs
+    that differ only in their extension keep it in the name, e.g. f0_txt and f0_csv.
+
+    Args:
+        file_paths (list of str): Input data files.
+
+    Returns:
+        list of str: Output paths relative to the output directory, without extension.
+    """
+    paths = [os.path.abspath(path) for path in file_paths]
+    root = os.path.commonpath([os.path.dirname(path) for path in paths]) if paths else ''
+    stems = [os.path.splitext(os.path.relpath(path, root))[0] for path in paths]
+    names = []
+    for path, stem in zip(paths, stems):
+        if stems.count(stem) > 1:
+            stem = f"{stem}_{os.path.splitext(path)[1].lstrip('.')}"
+        names.append(stem)
+    return names
+
+def run_pipeline(method, file_paths, output_dir, output_format='csv', processes=None, step_cache=True):
+    """
+    Apply a saved method to many files in parallel without a GUI.
+
+    Args:
+        method (dict or str): The method configuration, or the path of a saved method JSON file.
+        file_paths (list of str): Input data files.
+        output_dir (str): Directory where processed files are written.
+        output_format (str): Extension of the output files, 'csv' or 'xlsx'.
+        processes (int, optional): Number of worker processes, defaults to the CPU count.
+            With 1 the files are processed in the current process.
+        step_cache (bool): Whether to memoise step results on disk (see process_file).
+
+    Returns:
+        list of tuple: (input path, output path or None, error message or None) per file,
+            in input order.
+    """
+    from .method_storage import load_method
+    config = load_method(method) if isinstance(method, str) else method
+    os.makedirs(output_dir, exist_ok=True)
+    args = [(config, path, output_dir, output_format, step_cache, name)
+            for path, name in zip(file_paths, output_names(file_paths))]
+    if processes == 1 or len(file_paths) <= 1:
+        return [_process_file_safely(*arg) for arg in args]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(_process_file_safely, *zip(*args)))
+
+def main(argv=None):
+    """Command line entry point: python -m Deep_Data.pipeline method.json data/*.csv -o out/"""
+    parser = argparse.ArgumentParser(description="Apply a saved Deep Data method to data files.")
+    parser.add_argument("method", help="Saved method JSON file")
+    parser.add_argument("inputs", nargs="+", help="Input data files or glob patterns")
+    parser.add_argument("-o", "--output-dir", default="output", help="Directory for processed files")
+    parser.add_argument("-f", "--format", default="csv", choices=["csv", "xlsx"], help="Output file format")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--no-step-cache", action="store_true", help="Recompute every step instead of reusing cached results")
+    args = parser.parse_args(argv)
+
+    file_paths = expand_inputs(args.inputs)
+    if not file_paths:
+        parser.error("no input files matched")
+    results = run_pipeline(args.method, file_paths, args.output_dir, args.format, args.jobs,
+                           step_cache=not args.no_step_cache)
+    failures = 0
+    for file_path, output_path, error in results:
+        if error is None:
+            print(f"{file_path} -> {output_path}")
+        else:
+            failures += 1
+            print(f"{file_path} failed: {error}", file=sys.stderr)
+    print(f"Processed {len(results) - failures}/{len(results)} files")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+from .column_cache import ColumnCache
+from .encoding import DEFAULT_HASH_BUCKETS, DEFAULT_SMOOTHING, encoder_from_dict, fit_encoders
+from .expressions import compile_expression, compile_script, split_statements
+from .imputation import DEFAULT_NEIGHBORS, impute
+
+# Sort direction of recently truncated columns
+_SORTED_CACHE = ColumnCache()
+
+def _target_frame(df, inplace):
+    """
+    Frame that receives the columns a step creates or modifies.
+    
+    In place this is df itself. Otherwise it is a shallow copy sharing every column
+    buffer with df; assigning a column replaces it in the copy only, so just the
+    created or modified columns are allocated.
+    """
+    return df if inplace else df.copy(deep=False)
+
+def apply_mathematical_transformation(df, expression, inplace=False):
+    """
+    Create or overwrite a column from a mathematical expression over existing columns.
+    
+    The expression is compiled once (and cached) into a vectorised evaluation over
+    whole columns; see expressions.compile_expression for the supported syntax. Several
+    assignments separated by newlines or semicolons are compiled together into one fused
+    pass (see expressions.compile_script).
+    
+    Args:
+        df (pd.DataFrame): The data to transform.
+        expression (str): Assignment such as "new_col = log10(col1 * 3 + 1)", or several
+            assignments, one per line.
+        inplace (bool): Whether to add the columns to df itself instead of a copy that
+            shares the unchanged columns with df.
+    
+    Returns:
+        pd.DataFrame: The DataFrame with the assigned columns.
+    
+    Raises:
+        ValueError: If the expression is not an assignment or cannot be evaluated.
+    """
+    try:
+        if len(split_statements(expression)) > 1:
+            columns = compile_script(expression).evaluate(df)
+        else:
+            compiled = compile_expression(expression)
+            columns = {compiled.target: compiled.evaluate(df)}
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error applying transformation: {str(e)}")
+    out = _target_frame(df, inplace)
+    for name, values in columns.items():
+        out[name] = values
+    return out
+
+def _sorted_order(series):
+    """
+    Sort direction of a column: 1 if ascending, -1 if descending, 0 if unsorted.
+    
+    The answer is cached per column buffer (see column_cache.ColumnCache).
+    """
+    if not isinstance(series.dtype, np.dtype) or series.dtype.kind not in 'iufM':
+        return 0
+    order = _SORTED_CACHE.get(series)
+    if order is None:
+        index = pd.Index(series.to_numpy(), copy=False)
+        order = 1 if index.is_monotonic_increasing else -1 if index.is_monotonic_decreasing else 0
+        _SORTED_CACHE.put(series, order)
+    return order
+
+def _window(series, order, lower, upper):
+    """Positions [start, stop) of the values within [lower, upper] in a sorted column."""
+    index = pd.Index(series.to_numpy(), copy=False)
+    if order < 0:
+        # Search the reversed view, which is ascending, and map the positions back
+        start, stop = _window(series.iloc[::-1], 1, lower, upper)
+        return len(index) - stop, len(index) - start
+    start = 0 if lower is None else index.searchsorted(lower, side='left')
+    stop = len(index) if upper is None else index.searchsorted(upper, side='right')
+    return start, max(start, stop)
+
+def truncate_data(df, column, lower=None, upper=None, inplace=False):
+    """
+    Keep only the rows whose value in a column lies within [lower, upper].
+    
+    When the column is sorted in either direction, such as 2θ angles or timestamps,
+    the window is found by binary search and the result is a slice of df that shares
+    its data; otherwise rows are selected with a mask.
+    
+    Args:
+        df (pd.DataFrame): The data to truncate.
+        column (str): Column holding the values to truncate on.
+        lower (float, optional): Smallest value to keep.
+        upper (float, optional): Largest value to keep.
+        inplace (bool): Whether to drop the rows from df itself.
+    
+    Returns:
+        pd.DataFrame: The truncated data.
+    
+    Raises:
+        ValueError: If the column does not exist.
+    """
+    if column not in df.columns:
+        raise ValueError(f"Unknown column: {column}")
+    order = _sorted_order(df[column])
+    if order:
+        start, stop = _window(df[column], order, lower, upper)
+        if not inplace:
+            return df.iloc[start:stop]
+        keep = np.zeros(len(df), dtype=bool)
+        keep[start:stop] = True
+    else:
+        keep = np.ones(len(df), dtype=bool)
+        if lower is not None:
+            keep &= (df[column] >= lower).to_numpy()
+        if upper is not None:
+            keep &= (df[column] <= upper).to_numpy()
+        if not inplace:
+            return df[keep]
+    # Drop by position: dropping labels would also remove rows sharing a label with a dropped row
+    index = df.index
+    df.index = pd.RangeIndex(len(df))
+    df.drop(index=np.flatnonzero(~keep), inplace=True)
+    df.index = index[keep]
+    return df
+
+def fill_missing_values(df, columns=None, method='mean', value=None, inplace=False, values=None,
+                        time_column=None, features=None, n_neighbors=DEFAULT_NEIGHBORS):
+    """
+    Fill missing values, touching only the columns that contain any.
+    
+    See imputation.impute for the methods. For data that arrives in chunks, compute
+    the fill values once with imputation.fill_statistics and pass them as values.
+    
+    Args:
+        df (pd.DataFrame): The data to fill.
+        columns (list, optional): Columns to fill, defaults to all columns.
+        method (str): 'mean', 'median', 'mode', 'ffill', 'bfill', 'linear', 'time',
+            'knn' or 'value'.
+        value (optional): Fill value for method 'value'.
+        inplace (bool): Whether to replace the columns in df itself instead of a copy
+            that shares the untouched columns with df.
+        values (dict, optional): Precomputed fill value per column.
+        time_column (str, optional): Column of timestamps for method 'time'.
+        features (list, optional): Distance columns for method 'knn'.
+        n_neighbors (int): Number of neighbours for method 'knn'.
+    
+    Returns:
+        pd.DataFrame: The filled data.
+    
+    Raises:
+        ValueError: If the method is unknown or cannot be applied.
+    """
+    filled = impute(df, columns, method, value, values, time_column, features, n_neighbors)
+    out = _target_frame(df, inplace)
+    for col, series in filled.items():
+        out[col] = series
+    return out
+
+def encode_categorical(df, columns=None, method='ordinal', inplace=False, encoders=None, target=None,
+                       n_features=DEFAULT_HASH_BUCKETS, smoothing=DEFAULT_SMOOTHING):
+    """
+    Encode text or categorical columns as numbers.
+    
+    Encoders work on integer category codes, so each distinct value is looked up once
+    rather than once per row (see encoding.py). When fitted encoders are given, as
+    stored in a method's encode step, their vocabularies are applied unchanged, which
+    keeps the encoding of new data or of chunks of a large file consistent.
+    
+    Args:
+        df (pd.DataFrame): The data to encode.
+        columns (list, optional): Columns to encode, defaults to all text and categorical columns.
+        method (str): 'ordinal' for integer codes, 'onehot' for one sparse indicator
+            column per category, 'hashing' for a hash bucket number or 'target' for the
+            smoothed mean of a target column per category.
+        inplace (bool): Whether to modify df itself instead of a copy that shares the
+            untouched columns with df. One-hot encoding always returns a new frame.
+        encoders (dict, optional): Fitted encoder state per column from
+            encoding.fit_encoders; columns and method are ignored when given.
+        target (str, optional): Numeric target column for method 'target'.
+        n_features (int): Number of buckets for method 'hashing'.
+        smoothing (float): Smoothing weight for method 'target'.
+    
+    Returns:
+        pd.DataFrame: The encoded data.
+    
+    Raises:
+        ValueError: If the method is unknown or a column does not exist.
+    """
+    if encoders is None:
+        encoders = fit_encoders(df, columns, method, target, n_features, smoothing)
+    out = _target_frame(df, inplace)
+    for col, state in encoders.items():
+        if col not in out.columns:
+            raise ValueError(f"Unknown column: {col}")
+        encoded = encoder_from_dict(state).transform(out[col], col)
+        if list(encoded) == [col]:
+            out[col] = encoded[col]
+        else:
+            # Splice the indicator columns in where the source column was
+            position = out.columns.get_loc(col)
+            indicators = pd.DataFrame(encoded, index=out.index)
+            out = pd.concat([out.iloc[:, :position], indicators, out.iloc[:, position + 1:]], axis=1)
+    return out
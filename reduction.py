@@ -0,0 +1,239 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from .column_cache import ColumnCache
+
+# Rows converted to a float matrix at a time
+BLOCK_ROWS = 50_000
+
+# Number of features above which PCA uses the randomized solver by default
+RANDOMIZED_MIN_FEATURES = 1000
+
+# Extra directions sampled by the randomized solver, and its number of power iterations
+OVERSAMPLING = 10
+POWER_ITERATIONS = 4
+
+# Rows a nonlinear embedding is fitted on; the other rows are projected onto it
+DEFAULT_SAMPLE_SIZE = 20_000
+
+# Dimensions kept by the PCA that precedes a nonlinear embedding
+PRE_PCA_COMPONENTS = 50
+
+# Fitted neighbours whose embedding positions place a projected row
+PROJECTION_NEIGHBORS = 10
+
+# Methods accepted by reduce_dimensions
+REDUCTION_METHODS = ('pca', 'tsne', 'umap')
+
+class Projection:
+    """A fitted linear projection: the data mean and the principal axes, largest variance first."""
+
+    def __init__(self, mean, components, explained_variance):
+        self.mean = mean
+        self.components = components
+        self.explained_variance = explained_variance
+
+    def transform(self, block):
+        return (block - self.mean) @ self.components.T
+
+def _blocks(n_rows, block_rows=BLOCK_ROWS):
+    return [(start, min(start + block_rows, n_rows)) for start in range(0, n_rows, block_rows)]
+
+def _block(df, columns, start, stop):
+    """Rows [start, stop) of the columns as a float matrix and the mask of rows without missing values."""
+    values = df[columns].iloc[start:stop].to_numpy(dtype=float, na_value=np.nan)
+    valid = ~np.isnan(values).any(axis=1)
+    return values, valid
+
+def _map_blocks(function, df, columns, workers):
+    """Apply function(start, values, valid) to every block, on a thread pool."""
+    blocks = _blocks(len(df))
+    def run(bounds):
+        values, valid = _block(df, columns, *bounds)
+        return function(bounds[0], values, valid)
+    if workers == 1 or len(blocks) <= 1:
+        return [run(bounds) for bounds in blocks]
+    # numpy and BLAS release the GIL, so blocks are processed on all cores
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(executor.map(run, blocks))
+
+def _mean(df, columns, workers):
+    sums = _map_blocks(lambda start, values, valid: (valid.sum(), values[valid].sum(axis=0)), df, columns, workers)
+    count = sum(count for count, _ in sums)
+    if count < 2:
+        raise ValueError("PCA needs at least two rows without missing values.")
+    return count, sum(total for _, total in sums) / count
+
+def _covariance_pca(df, columns, n_components, workers):
+    """Exact PCA from the covariance matrix, accumulated block by block."""
+    count, mean = _mean(df, columns, workers)
+    def scatter(start, values, valid):
+        centred = values[valid] - mean
+        return centred.T @ centred
+    covariance = sum(_map_blocks(scatter, df, columns, workers)) / (count - 1)
+    variances, vectors = np.linalg.eigh(covariance)
+    order = np.argsort(variances)[::-1][:n_components]
+    return Projection(mean, vectors[:, order].T, variances[order])
+
+def _randomized_pca(df, columns, n_components, workers, seed):
+    """
+    PCA by randomized subspace iteration, streaming the data once per iteration.
+
+    Only d x (n_components + OVERSAMPLING) matrices are held, instead of the d x d
+    covariance matrix.
+    """
+    count, mean = _mean(df, columns, workers)
+    rng = np.random.default_rng(seed)
+    basis = rng.standard_normal((len(columns), min(n_components + OVERSAMPLING, len(columns))))
+    def sketch(start, values, valid):
+        centred = values[valid] - mean
+        return centred.T @ (centred @ basis)
+    for _ in range(POWER_ITERATIONS + 1):
+        basis, _ = np.linalg.qr(sum(_map_blocks(sketch, df, columns, workers)))
+    def reduced(start, values, valid):
+        projected = (values[valid] - mean) @ basis
+        return projected.T @ projected
+    variances, vectors = np.linalg.eigh(sum(_map_blocks(reduced, df, columns, workers)) / (count - 1))
+    order = np.argsort(variances)[::-1][:n_components]
+    return Projection(mean, (basis @ vectors[:, order]).T, variances[order])
+
+def fit_pca(df, columns, n_components=2, solver='auto', workers=None, seed=0):
+    """
+    Fit a PCA over the rows of df without missing values, streaming them in blocks.
+
+    Args:
+        df (pd.DataFrame): The data.
+        columns (list): Numeric feature columns.
+        n_components (int): Number of principal axes.
+        solver (str): 'covariance' for an exact fit from the d x d covariance matrix,
+            'randomized' for randomized subspace iteration, or 'auto' to use the
+            randomized solver above RANDOMIZED_MIN_FEATURES features.
+        workers (int, optional): Number of threads, defaults to the CPU count.
+        seed (int): Seed of the randomized solver.
+
+    Returns:
+        Projection: The fitted projection.
+
+    Raises:
+        ValueError: If the solver is unknown or there are too few complete rows.
+    """
+    if solver == 'auto':
+        solver = 'randomized' if len(columns) > RANDOMIZED_MIN_FEATURES else 'covariance'
+    n_components = min(n_components, len(columns))
+    if solver == 'covariance':
+        return _covariance_pca(df, columns, n_components, workers)
+    if solver == 'randomized':
+        return _randomized_pca(df, columns, n_components, workers, seed)
+    raise ValueError(f"Unknown PCA solver: {solver}")
+
+def project(df, columns, projection, workers=None, dtype=np.float64):
+    """
+    Project every row of df with a fitted projection, block by block.
+
+    Returns:
+        np.ndarray: Coordinates of shape (rows, components), NaN for rows with missing values.
+    """
+    coords = np.full((len(df), len(projection.components)), np.nan, dtype=dtype)
+    def fill(start, values, valid):
+        block = np.full((len(values), coords.shape[1]), np.nan)
+        block[valid] = projection.transform(values[valid])
+        coords[start:start + len(values)] = block
+    _map_blocks(fill, df, columns, workers)
+    return coords
+
+def _fit_embedding(method, sample, n_components, seed):
+    """Fit a nonlinear embedding on a sample; returns its coordinates and a transform for new rows, if any."""
+    if method == 'tsne':
+        try:
+            from sklearn.manifold import TSNE
+        except ImportError:
+            raise ValueError("t-SNE requires scikit-learn.")
+        return TSNE(n_components=n_components, init='pca', random_state=seed).fit_transform(sample), None
+    try:
+        import umap
+    except ImportError:
+        raise ValueError("UMAP requires umap-learn.")
+    model = umap.UMAP(n_components=n_components, random_state=seed)
+    return model.fit_transform(sample), model.transform
+
+def _embed(df, columns, method, n_components, sample_size, workers, seed):
+    """Subsample, fit a nonlinear embedding on the sample and project the remaining rows onto it."""
+    pca = fit_pca(df, columns, PRE_PCA_COMPONENTS, workers=workers, seed=seed)
+    reduced = project(df, columns, pca, workers, dtype=np.float32)
+    valid = np.flatnonzero(~np.isnan(reduced).any(axis=1))
+    rng = np.random.default_rng(seed)
+    sample = np.sort(rng.choice(valid, min(sample_size, len(valid)), replace=False))
+    fitted, transform = _fit_embedding(method, reduced[sample], n_components, seed)
+    coords = np.full((len(df), n_components), np.nan)
+    coords[sample] = fitted
+    rest = np.setdiff1d(valid, sample, assume_unique=True)
+    if not len(rest):
+        return coords
+    if transform is not None:
+        for start, stop in _blocks(len(rest)):
+            coords[rest[start:stop]] = transform(reduced[rest[start:stop]])
+        return coords
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        raise ValueError("Projecting onto a t-SNE embedding requires scipy.")
+    # Place each remaining row at the distance-weighted mean of its nearest fitted rows
+    k = min(PROJECTION_NEIGHBORS, len(sample))
+    distances, neighbours = cKDTree(reduced[sample]).query(reduced[rest], k=k, workers=workers or -1)
+    distances, neighbours = distances.reshape(len(rest), k), neighbours.reshape(len(rest), k)
+    weights = 1 / np.maximum(distances, 1e-12)
+    coords[rest] = np.einsum('nk,nkc->nc', weights, fitted[neighbours]) / weights.sum(axis=1, keepdims=True)
+    return coords
+
+# Coordinates of recent reductions, keyed on the buffers of their input columns
+_REDUCTION_CACHE = ColumnCache(maxsize=8)
+
+def reduce_dimensions(df, columns=None, method='pca', n_components=2, sample_size=DEFAULT_SAMPLE_SIZE,
+                      solver='auto', workers=None, seed=0):
+    """
+    Reduce numeric columns to a few dimensions.
+
+    'pca' streams the data in blocks on all cores (see fit_pca). 'tsne' and 'umap'
+    first reduce the data to PRE_PCA_COMPONENTS dimensions with PCA, fit the
+    embedding on a random sample of sample_size rows, then project the remaining
+    rows onto it: with UMAP's transform, or for t-SNE by placing each row among its
+    nearest fitted rows. Results are cached per version of the input columns, so
+    plotting the same reduction again, e.g. with another colouring, does not refit.
+
+    Args:
+        df (pd.DataFrame): The data.
+        columns (list, optional): Feature columns, defaults to all numeric columns.
+        method (str): 'pca', 'tsne' or 'umap'.
+        n_components (int): Number of output dimensions.
+        sample_size (int): Number of rows a nonlinear embedding is fitted on.
+        solver (str): PCA solver, see fit_pca.
+        workers (int, optional): Number of threads, defaults to the CPU count.
+        seed (int): Seed of the sampling and of the fitted models.
+
+    Returns:
+        np.ndarray: Coordinates of shape (rows, n_components), NaN for rows with missing values.
+
+    Raises:
+        ValueError: If the method is unknown, a column is not numeric or a required
+            library is not installed.
+    """
+    if method not in REDUCTION_METHODS:
+        raise ValueError(f"Unknown reduction method: {method}")
+    if columns is None:
+        columns = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+    for col in columns:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            raise ValueError(f"Column {col} is not numeric.")
+    if not columns:
+        raise ValueError("Dimensionality reduction needs numeric columns.")
+    series = [df[col] for col in columns]
+    options = (tuple(columns), method, n_components, sample_size, solver, seed)
+    coords = _REDUCTION_CACHE.get(series, options)
+    if coords is None:
+        if method == 'pca':
+            coords = project(df, columns, fit_pca(df, columns, n_components, solver, workers, seed), workers)
+        else:
+            coords = _embed(df, columns, method, n_components, sample_size, workers, seed)
+        _REDUCTION_CACHE.put(series, coords, options)
+    return coords
@@ -0,0 +1,119 @@
+import queue
+import threading
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+class RenderCancelled(Exception):
+    """Raised inside a render job when a newer job has superseded it."""
+
+class RenderResult:
+    """A finished render: the figure, its axes, the Agg canvas holding the pixels and the plot's return value."""
+
+    def __init__(self, generation, figure=None, ax=None, canvas=None, value=None, error=None):
+        self.generation = generation
+        self.figure = figure
+        self.ax = ax
+        self.canvas = canvas
+        self.value = value
+        self.error = error
+
+class RenderWorker:
+    """
+    Background thread that builds and rasterises figures with the Agg backend.
+
+    Each job gets a new Figure of the requested size, so the worker never touches a
+    figure the Tk loop is showing. The plot function fills the axes (binning,
+    downsampling and other heavy work happen here), the figure is drawn into an
+    RGBA buffer, and the result is handed back through a queue for the Tk loop to
+    display. Submitting a job supersedes any earlier one: queued jobs are skipped,
+    a running job is dropped at its next checkpoint, and results of superseded jobs
+    are discarded.
+    """
+
+    def __init__(self):
+        self.generation = 0  # Number of the most recently submitted job
+        self.pending = None  # Job waiting for the worker, only the latest is kept
+        self.condition = threading.Condition()
+        self.results = queue.Queue()
+        self.running = False  # Whether the worker is inside a job
+        self.thread = None
+
+    def submit(self, plot, size_inches, dpi):
+        """
+        Render a plot in the background, superseding any earlier job.
+
+        Args:
+            plot (callable): Called with the new figure's axes to draw the plot; its
+                return value is passed back in the result.
+            size_inches (tuple): Figure size, e.g. the displayed figure's get_size_inches().
+            dpi (float): Figure resolution.
+
+        Returns:
+            int: Generation number of the job.
+        """
+        with self.condition:
+            self.generation += 1
+            self.pending = (self.generation, plot, tuple(size_inches), dpi)
+            self.condition.notify()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        return self.generation
+
+    def cancel(self):
+        """Drop the queued and running jobs."""
+        with self.condition:
+            self.generation += 1
+            self.pending = None
+
+    def busy(self):
+        """Whether a job is queued, running or waiting to be collected."""
+        with self.condition:
+            return self.pending is not None or self.running or not self.results.empty()
+
+    def _check(self, generation):
+        if generation != self.generation:
+            raise RenderCancelled()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.pending is None:
+                    self.condition.wait()
+                generation, plot, size_inches, dpi = self.pending
+                self.pending = None
+                self.running = True
+            try:
+                figure = Figure(figsize=size_inches, dpi=dpi)
+                canvas = FigureCanvasAgg(figure)
+                ax = figure.add_subplot()
+                value = plot(ax)
+                self._check(generation)
+                canvas.draw()
+                self._check(generation)
+                self.results.put(RenderResult(generation, figure, ax, canvas, value))
+            except RenderCancelled:
+                pass
+            except Exception as e:
+                self.results.put(RenderResult(generation, error=e))
+            finally:
+                with self.condition:
+                    self.running = False
+
+    def poll(self):
+        """
+        Collect the result of the latest job if it has finished.
+
+        Returns:
+            RenderResult or None: The result, or None while it is not ready. Results of
+                superseded jobs are discarded.
+        """
+        latest = None
+        while True:
+            try:
+                result = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if result.generation == self.generation:
+                latest = result
+        return latest
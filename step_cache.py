@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+import pandas as pd
+from .data_cache import DEFAULT_CACHE_BYTES, DEFAULT_CACHE_DIR, load_frame, store_frame
+
+# Directory holding the results of method steps
+DEFAULT_STEP_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'steps')
+
+# Number of step results kept in memory
+DEFAULT_MEMORY_ITEMS = 8
+
+def hash_frame(df):
+    """
+    Content hash of a DataFrame's values, column names and dtypes.
+
+    Args:
+        df (pd.DataFrame): The data to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha1()
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def step_keys(data_key, steps):
+    """
+    Chain the hash of the input data through the steps of a method.
+
+    Each key covers the input data and every step up to and including its own, so
+    editing a step changes its key and the keys of all steps after it, while the
+    keys of earlier steps stay valid.
+
+    Args:
+        data_key (str): Hash identifying the input data.
+        steps (list of dict): The method steps.
+
+    Returns:
+        list of str: One key per step.
+    """
+    keys = []
+    key = data_key
+    for step in steps:
+        key = hashlib.sha1((key + json.dumps(step, sort_keys=True, default=str)).encode()).hexdigest()
+        keys.append(key)
+    return keys
+
+class StepCache:
+    """
+    Two-level cache of method step results: recent results in memory, all results
+    on disk as Arrow IPC files evicted least recently used first.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_CACHE_BYTES, memory_items=DEFAULT_MEMORY_ITEMS):
+        """
+        Args:
+            cache_dir (str, optional): Directory for step results, defaults to DEFAULT_STEP_CACHE_DIR.
+                None of the results are written to disk when cache_dir is False.
+            max_bytes (int): Maximum total size of the cache directory.
+            memory_items (int): Number of results kept in memory.
+        """
+        self.cache_dir = DEFAULT_STEP_CACHE_DIR if cache_dir is None else cache_dir
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.memory = OrderedDict()
+
+    def get(self, key):
+        """
+        Look up the result of a step.
+
+        Args:
+            key (str): Key of the step (see step_keys).
+
+        Returns:
+            pd.DataFrame or None: The cached result, or None on a miss.
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        if not self.cache_dir:
+            return None
+        df = load_frame(key, self.cache_dir)
+        if df is not None:
+            self._remember(key, df)
+        return df
+
+    def put(self, key, df):
+        """
+        Store the result of a step.
+
+        Args:
+            key (str): Key of the step (see step_keys).
+            df (pd.DataFrame): The result of the step; it must not be modified afterwards.
+        """
+        self._remember(key, df)
+        if self.cache_dir:
+            store_frame(key, df, self.cache_dir, self.max_bytes)
+
+    def _remember(self, key, df):
+        """Keep a result in memory, dropping the least recently used ones."""
+        self.memory[key] = df
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
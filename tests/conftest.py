@@ -0,0 +1,15 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+# The repository directory is the package; import it by its directory name as the benchmarks do
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(PACKAGE_DIR))
+
+@pytest.fixture
+def package():
+    """Import a submodule of the package by name, e.g. package('expressions')."""
+    name = os.path.basename(PACKAGE_DIR)
+    return lambda module: importlib.import_module(f"{name}.{module}")
@@ -0,0 +1,24 @@
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+
+def test_entries_do_not_keep_columns_alive(package):
+    cache = package('column_cache').ColumnCache()
+    df = pd.DataFrame(np.zeros((1000, 4)))
+    owner = weakref.ref(df[0].to_numpy().base)
+    cache.put(df[0], 'value')
+    assert cache.get(df[0]) == 'value'
+    del df
+    gc.collect()
+    assert owner() is None
+
+def test_mark_written_invalidates(package):
+    column_cache = package('column_cache')
+    cache = column_cache.ColumnCache()
+    df = pd.DataFrame({'t': np.arange(10.0)})
+    cache.put(df['t'], 1)
+    df.loc[3, 't'] = 100.0
+    column_cache.mark_written()
+    assert cache.get(df['t']) is None
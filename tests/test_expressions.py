@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+# Expressions whose integer or bool arithmetic differs between numexpr and NumPy
+# unless literals and result dtypes are reconciled
+EXPRESSIONS = [
+    "flag = where(a > 0, 100000, 0) * 100000",
+    "x = c * 100000 * 100000",
+    "x = abs(b - 3)",
+    "y = 2",
+    "x = c + c + 1",
+    "x = b * 3000000000",
+    "x = where(c, b, 1.5)",
+    "x = sqrt(b) + a % 3",
+]
+
+def _frame(n_rows):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'a': rng.standard_normal(n_rows),
+        'b': rng.integers(0, 10, n_rows),
+        'c': rng.integers(0, 2, n_rows).astype(bool),
+    })
+
+@pytest.mark.parametrize('expression', EXPRESSIONS)
+def test_result_does_not_depend_on_row_count(package, expression):
+    compiled = package('expressions').compile_expression(expression)
+    df = _frame(20_000)
+    small = compiled.evaluate(df.head(100))
+    large = compiled.evaluate(df)
+    assert small.dtype == large.dtype
+    np.testing.assert_array_equal(large[:100], small)
@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+
+def test_rebin_keeps_every_count(package):
+    histogram = package('histogram')
+    h = histogram.Histogram()
+    h.update(np.array([10.0, 20.0]))
+    h.update(np.array([9.99]))
+    for bins in (1, 4, 7, 50):
+        assert h.rebin(bins)[0].sum() == 3
+
+def test_chunk_histograms_keep_every_count(package):
+    histogram = package('histogram')
+    rng = np.random.default_rng(0)
+    chunks = [pd.DataFrame({'x': rng.standard_normal(50_000) * scale + shift})
+              for scale, shift in [(1, 0), (3, -5), (0.1, 8), (10, 2)]]
+    h = histogram.chunk_histograms(chunks)['x']
+    assert h.rebin(50)[0].sum() == 200_000
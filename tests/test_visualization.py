@@ -0,0 +1,11 @@
+import numpy as np
+
+def test_minmax_downsample_ignores_missing_values(package):
+    visualization = package('visualization')
+    y = np.random.default_rng(0).standard_normal(100_000)
+    y[:3] = np.nan
+    y[5] = 50.0
+    y[1000:2000] = np.nan
+    y[50_000] = -50.0
+    picked = y[visualization.minmax_downsample(y, 100)]
+    assert 50.0 in picked and -50.0 in picked
@@ -0,0 +1,452 @@
+import matplotlib.dates as mdates
+import numpy as np
+import pandas as pd
+from matplotlib.colors import LogNorm
+from matplotlib.image import AxesImage
+from .histogram import BLOCK_ROWS, column_histogram, numeric_values
+from .reduction import reduce_dimensions
+
+# Lines with at most this many points per pixel column are drawn without downsampling
+LOD_POINTS_PER_PIXEL = 2
+
+# Points per block of the finest level of an LODLine's min/max pyramid
+LOD_BLOCK_ROWS = 64
+
+# Ratio of the block sizes of consecutive pyramid levels
+LOD_LEVEL_FACTOR = 8
+
+# Number of points above which cross plots are drawn as a density raster instead of a scatter
+RASTER_THRESHOLD = 100_000
+
+def clear_axes(ax):
+    """Clear an axes, including the animated title a DistributionPlot leaves on it."""
+    ax.clear()
+    ax.title.set_animated(False)
+
+def plot_single_distribution(ax, data, column=None, bins=50, range=None):
+    """
+    Plot the histogram of a numeric column.
+
+    Bin counts come from the column's cached fine histogram (see histogram.py), so
+    changing the number of bins or the range does not touch the data again and only
+    the counts are handed to matplotlib.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on; it is cleared first.
+        data (pd.DataFrame or pd.Series): The data, or the column itself.
+        column (str, optional): Column to plot when data is a DataFrame.
+        bins (int): Number of bins.
+        range (tuple, optional): (lower, upper) of the bins, defaults to the data range.
+
+    Returns:
+        matplotlib.patches.StepPatch: The drawn histogram.
+
+    Raises:
+        ValueError: If the column is not numeric.
+    """
+    series = data if column is None else data[column]
+    counts, edges = column_histogram(series).rebin(bins, range)
+    clear_axes(ax)
+    patch = ax.stairs(counts, edges, fill=True)
+    ax.set_title(f"Distribution of {series.name}")
+    ax.set_ylabel("Count")
+    return patch
+
+def _nice_ceiling(value):
+    """Smallest of 1, 2 or 5 times a power of ten that is at least value."""
+    if value <= 0:
+        return 1
+    power = 10 ** np.floor(np.log10(value))
+    return next(step * power for step in (1, 2, 5, 10) if step * power >= value)
+
+class DistributionPlot:
+    """
+    Distribution plot that keeps its artists and blits updates onto a cached background.
+
+    The histogram patch and the title are animated artists: a full draw renders the
+    axes, ticks and labels, and the background is captured on the canvas' draw_event.
+    Showing another column or bin count updates the patch in place with set_data;
+    when the axis limits stay the same, the background is restored and only the
+    patch and title are redrawn and blitted. The count axis is rounded up to 1, 2
+    or 5 times a power of ten so it changes rarely. Changed limits, resizing and
+    zooming fall back to one full draw, which recaptures the background.
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.patch = None
+        self.background = None
+        self.limits = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _animated(self):
+        return (self.patch, self.ax.title)
+
+    def _active(self):
+        """Whether the patch is still on the axes, i.e. no other plot cleared it."""
+        return self.patch is not None and self.patch in self.ax.patches
+
+    def _build(self):
+        clear_axes(self.ax)
+        self.patch = self.ax.stairs([0], [0, 1], fill=True)
+        self.ax.set_ylabel("Count")
+        for artist in self._animated():
+            artist.set_animated(True)
+        self.background = None
+
+    def _on_draw(self, event):
+        if not self._active():
+            self.background = None
+            return
+        self.background = self.canvas.copy_from_bbox(self.ax.figure.bbox)
+        # Zooming changes the limits behind our back
+        self.limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated():
+            self.ax.draw_artist(artist)
+
+    def show(self, series, bins=50, range=None):
+        """
+        Show the histogram of a column, blitting when the axes can be reused.
+
+        Args:
+            series (pd.Series): A numeric column.
+            bins (int): Number of bins.
+            range (tuple, optional): (lower, upper) of the bins, defaults to the data range.
+
+        Raises:
+            ValueError: If the column is not numeric.
+        """
+        counts, edges = column_histogram(series).rebin(bins, range)
+        if not self._active():
+            self._build()
+        self.patch.set_data(counts, edges)
+        self.ax.title.set_text(f"Distribution of {series.name}")
+        limits = ((float(edges[0]), float(edges[-1])), (0.0, float(_nice_ceiling(counts.max() * 1.05))))
+        if self.background is None or limits != self.limits:
+            self.ax.set_xlim(limits[0])
+            self.ax.set_ylim(limits[1])
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+        self.canvas.blit(self.ax.figure.bbox)
+
+def density_grid(x, y, xlim, ylim, width, height):
+    """
+    Count the points falling into each cell of a width x height grid over a view.
+
+    Points are binned in blocks of BLOCK_ROWS with np.bincount, so memory stays
+    bounded and the cost is one pass over the data.
+
+    Args:
+        x (np.ndarray): Horizontal coordinates, NaN for missing values.
+        y (np.ndarray): Vertical coordinates, NaN for missing values.
+        xlim (tuple): (left, right) of the view.
+        ylim (tuple): (bottom, top) of the view.
+        width (int): Number of columns of the grid.
+        height (int): Number of rows of the grid.
+
+    Returns:
+        np.ndarray: Counts of shape (height, width), the first cell at the smallest x and y.
+    """
+    (x0, x1), (y0, y1) = sorted(xlim), sorted(ylim)
+    counts = np.zeros(width * height, dtype=np.int64)
+    if x1 <= x0 or y1 <= y0:
+        return counts.reshape(height, width)
+    for start in range(0, len(x), BLOCK_ROWS):
+        bx, by = x[start:start + BLOCK_ROWS], y[start:start + BLOCK_ROWS]
+        # Comparisons with NaN are false, so missing values drop out here
+        inside = (bx >= x0) & (bx <= x1) & (by >= y0) & (by <= y1)
+        ix = np.minimum(((bx[inside] - x0) * (width / (x1 - x0))).astype(np.int64), width - 1)
+        iy = np.minimum(((by[inside] - y0) * (height / (y1 - y0))).astype(np.int64), height - 1)
+        counts += np.bincount(iy * width + ix, minlength=width * height)
+    return counts.reshape(height, width)
+
+class DensityImage(AxesImage):
+    """
+    Image of point counts per screen pixel, re-aggregated for the visible region.
+
+    Before each draw the image checks the view limits and the pixel size of the
+    axes; when either changed since the last aggregation, only the points inside
+    the new view are binned again, at one cell per pixel. Empty cells are
+    transparent and counts use a logarithmic colour scale.
+    """
+
+    def __init__(self, ax, x, y, cmap='viridis', **kwargs):
+        super().__init__(ax, cmap=cmap, norm=LogNorm(), origin='lower', interpolation='nearest', **kwargs)
+        self.x = x
+        self.y = y
+        self._view = None
+
+    def _aggregate(self):
+        xlim, ylim = self.axes.get_xlim(), self.axes.get_ylim()
+        width, height = max(int(self.axes.bbox.width), 1), max(int(self.axes.bbox.height), 1)
+        view = (xlim, ylim, width, height)
+        if view == self._view:
+            return
+        self._view = view
+        counts = density_grid(self.x, self.y, xlim, ylim, width, height)
+        self.set_data(np.ma.masked_equal(counts, 0))
+        self.norm.vmin, self.norm.vmax = 1, max(int(counts.max()), 1)
+        # The grid runs from the smallest x and y, also on reversed axes
+        self.set_extent((*sorted(xlim), *sorted(ylim)))
+
+    def draw(self, renderer):
+        self._aggregate()
+        super().draw(renderer)
+
+def _plot_density(ax, xs, ys, xlim, ylim):
+    """Add a DensityImage of the points with fixed view limits."""
+    artist = DensityImage(ax, xs, ys)
+    ax.add_image(artist)
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+    # Fixed limits, so aggregating the view does not feed back into autoscaling
+    ax.set_autoscale_on(False)
+    return artist
+
+def plot_cross_relationship(ax, data, x, y, raster_threshold=RASTER_THRESHOLD):
+    """
+    Plot one numeric column against another.
+
+    Up to raster_threshold points are drawn as a scatter. Above it the points are
+    drawn as a DensityImage, so the cost of a draw depends on the number of pixels
+    rather than points, and zooming or panning re-aggregates the visible region.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on; it is cleared first.
+        data (pd.DataFrame): The data.
+        x (str): Column on the horizontal axis.
+        y (str): Column on the vertical axis.
+        raster_threshold (int): Largest number of points drawn as a scatter.
+
+    Returns:
+        matplotlib.artist.Artist: The scatter collection or the DensityImage.
+
+    Raises:
+        ValueError: If a column is not numeric.
+    """
+    xs, ys = numeric_values(data[x]), numeric_values(data[y])
+    clear_axes(ax)
+    if len(xs) <= raster_threshold:
+        artist = ax.scatter(xs, ys, s=4, alpha=0.5)
+    else:
+        # The cached histograms know the finite range of each column
+        xlim, ylim = [(histogram.min, histogram.max) if histogram.lo is not None else (0, 1)
+                      for histogram in (column_histogram(data[x]), column_histogram(data[y]))]
+        artist = _plot_density(ax, xs, ys, xlim, ylim)
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+    ax.set_title(f"{y} vs {x}")
+    return artist
+
+def _extremes(runs):
+    """
+    Positions of the minimum and maximum along the last axis, ignoring NaN.
+
+    argmin and argmax would return the first NaN. A run that is all NaN gives its
+    first position, so the gap it draws in the line is kept.
+    """
+    if runs.dtype.kind == 'f':
+        missing = np.isnan(runs)
+        if missing.any():
+            return np.where(missing, np.inf, runs).argmin(axis=-1), np.where(missing, -np.inf, runs).argmax(axis=-1)
+    return runs.argmin(axis=-1), runs.argmax(axis=-1)
+
+def minmax_downsample(y, buckets):
+    """
+    Indices of the minimum and maximum of each of buckets equal runs of y, in order.
+
+    Drawing these points gives the same vertical extent per bucket as drawing every
+    point, so narrow peaks stay visible. The work is a single vectorised argmin and
+    argmax over the values reshaped into buckets; missing values are ignored.
+
+    Args:
+        y (np.ndarray): The values.
+        buckets (int): Number of runs, typically the pixel width of the plot.
+
+    Returns:
+        np.ndarray: Sorted indices into y, including the first and last point.
+    """
+    n = len(y)
+    if n <= LOD_POINTS_PER_PIXEL * buckets:
+        return np.arange(n)
+    size = n // buckets
+    runs = y[:size * buckets].reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lows, highs = _extremes(runs)
+    picks = [offsets + lows, offsets + highs, [0, n - 1]]
+    if size * buckets < n:
+        picks.append(size * buckets + np.array(_extremes(y[size * buckets:])))
+    return np.unique(np.concatenate(picks))
+
+class LODLine:
+    """
+    Line whose vertices are downsampled to the visible x range and pixel width.
+
+    On creation a pyramid of per-block minimum and maximum positions is built, with
+    blocks of LOD_BLOCK_ROWS points growing by LOD_LEVEL_FACTOR per level. The line
+    listens to the axes' xlim_changed callback and the canvas resize event; on each
+    change the visible range of the sorted x values is found by binary search, the
+    coarsest level with enough blocks per pixel supplies the candidate extremes, and
+    minmax_downsample keeps the minimum and maximum per pixel column among them. A
+    redraw therefore handles a few points per pixel whatever the length of the line.
+    """
+
+    def __init__(self, ax, x, y, **kwargs):
+        self.ax = ax
+        self.x = x
+        self.y = np.ascontiguousarray(y)
+        # Binary search needs ascending x; otherwise runs are taken over the whole line
+        self.sorted = bool(len(x) < 2 or np.all(x[1:] >= x[:-1]))
+        self.levels = self._build_levels()
+        self.line, = ax.plot([], [], **kwargs)
+        # Callback registries hold bound methods weakly; the drawn line keeps this object
+        # alive for as long as it is on the axes
+        self.line.lod = self
+        self._view = None
+        self.update()
+        ax.callbacks.connect('xlim_changed', self.update)
+        ax.figure.canvas.mpl_connect('resize_event', self.update)
+
+    def _build_levels(self):
+        """(block size, positions of each block's minimum and maximum) per level, finest first."""
+        levels = []
+        size, positions = 1, None
+        while len(self.y) // (size * LOD_LEVEL_FACTOR if levels else LOD_BLOCK_ROWS) >= 1:
+            step = LOD_LEVEL_FACTOR if levels else LOD_BLOCK_ROWS
+            if positions is None:
+                # First level: reduce the values themselves
+                blocks = len(self.y) // step
+                runs = self.y[:blocks * step].reshape(blocks, step)
+                offsets = np.arange(blocks) * step
+                lows, highs = _extremes(runs)
+                lows, highs = offsets + lows, offsets + highs
+            else:
+                # Later levels: reduce the extremes of the level below
+                blocks = len(positions[0]) // step
+                prev_lows = positions[0][:blocks * step].reshape(blocks, step)
+                prev_highs = positions[1][:blocks * step].reshape(blocks, step)
+                rows = np.arange(blocks)
+                lows = prev_lows[rows, _extremes(self.y[prev_lows])[0]]
+                highs = prev_highs[rows, _extremes(self.y[prev_highs])[1]]
+            size *= step
+            positions = (lows, highs)
+            levels.append((size, positions))
+        return levels
+
+    def _candidates(self, start, stop, width):
+        """Positions in [start, stop) that include the extremes of every pixel column."""
+        count = stop - start
+        level = None
+        for size, positions in self.levels:
+            if count // size >= LOD_POINTS_PER_PIXEL * width:
+                level = (size, positions)
+        if level is None:
+            return np.arange(start, stop)
+        size, (lows, highs) = level
+        first, last = -(-start // size), stop // size
+        # Points in the partial blocks at either edge are taken as they are
+        return np.unique(np.concatenate([
+            np.arange(start, first * size), lows[first:last], highs[first:last], np.arange(last * size, stop)]))
+
+    def update(self, *args):
+        """Recompute the drawn vertices for the current view."""
+        width = max(int(self.ax.bbox.width), 1)
+        start, stop = 0, len(self.x)
+        if self.sorted and self._view is not None:
+            lower, upper = sorted(self.ax.get_xlim())
+            # One point beyond each edge keeps the line running off the plot
+            start = max(np.searchsorted(self.x, lower, side='left') - 1, 0)
+            stop = min(np.searchsorted(self.x, upper, side='right') + 1, len(self.x))
+        view = (start, stop, width)
+        if view == self._view:
+            return
+        self._view = view
+        candidates = self._candidates(start, stop, width)
+        index = candidates[minmax_downsample(self.y[candidates], width)]
+        self.line.set_data(self.x[index], self.y[index])
+
+def plot_line(ax, data, x, y):
+    """
+    Plot a column against another as a line, e.g. an XRD spectrum or a time series.
+
+    Long lines are drawn through an LODLine, which keeps only the minimum and maximum
+    of each pixel column of the visible range and is recomputed on zoom and pan.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on; it is cleared first.
+        data (pd.DataFrame): The data.
+        x (str): Column on the horizontal axis, numeric or datetime.
+        y (str): Column on the vertical axis.
+
+    Returns:
+        LODLine: The drawn line.
+
+    Raises:
+        ValueError: If a column is not numeric.
+    """
+    clear_axes(ax)
+    if pd.api.types.is_datetime64_any_dtype(data[x]):
+        xs = mdates.date2num(data[x].to_numpy(dtype='datetime64[ns]'))
+        ax.xaxis_date()
+    else:
+        xs = numeric_values(data[x])
+    lod = LODLine(ax, xs, numeric_values(data[y]))
+    ax.relim()
+    ax.autoscale_view()
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+    ax.set_title(f"{y} vs {x}")
+    return lod
+
+def reduce_and_plot(ax, data, columns=None, method='pca', color=None, raster_threshold=RASTER_THRESHOLD,
+                    **options):
+    """
+    Reduce numeric columns to two dimensions and plot the result.
+
+    The reduction is computed by reduction.reduce_dimensions and cached per version
+    of the data, so re-plotting with another colouring does not refit. Without a
+    colour column large results are drawn as a DensityImage; with one, a random
+    sample of raster_threshold rows is scattered and coloured.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on; it is cleared first.
+        data (pd.DataFrame): The data.
+        columns (list, optional): Feature columns, defaults to all numeric columns.
+        method (str): 'pca', 'tsne' or 'umap'.
+        color (str, optional): Column colouring the points; text columns are coloured
+            by category.
+        raster_threshold (int): Largest number of points drawn as a scatter.
+        **options: Further arguments of reduce_dimensions, e.g. sample_size or workers.
+
+    Returns:
+        np.ndarray: The coordinates of every row, NaN for rows with missing values.
+
+    Raises:
+        ValueError: If the reduction cannot be computed.
+    """
+    coords = reduce_dimensions(data, columns, method, n_components=2, **options)
+    xs, ys = coords[:, 0], coords[:, 1]
+    rows = np.flatnonzero(np.isfinite(xs) & np.isfinite(ys))
+    clear_axes(ax)
+    if color is None and len(rows) > raster_threshold:
+        _plot_density(ax, xs, ys, (xs[rows].min(), xs[rows].max()), (ys[rows].min(), ys[rows].max()))
+    else:
+        if len(rows) > raster_threshold:
+            rows = np.sort(np.random.default_rng(0).choice(rows, raster_threshold, replace=False))
+        colors = None
+        if color is not None:
+            series = data[color].iloc[rows]
+            colors = (numeric_values(series) if pd.api.types.is_numeric_dtype(series)
+                      else pd.factorize(series)[0])
+        ax.scatter(xs[rows], ys[rows], c=colors, s=4, alpha=0.5)
+    label = {'pca': "PC", 'tsne': "t-SNE ", 'umap': "UMAP "}[method]
+    ax.set_xlabel(f"{label}1")
+    ax.set_ylabel(f"{label}2")
+    ax.set_title(f"{method.upper()} projection" + (f" coloured by {color}" if color else ""))
+    return coords